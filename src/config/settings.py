@@ -189,6 +189,10 @@ class HumanBehaviorSettings(BaseSettings):
     typo_probability: float = Field(default=0.02, description="Probability of making a typo (0-1)")
     mouse_movement: bool = Field(default=True, description="Enable natural mouse movement")
     random_delays: bool = Field(default=True, description="Enable random delays between actions")
+    realism: Literal["full", "fast", "off"] = Field(
+        default="full",
+        description="Form filling realism: full simulation, fast typing, or instant fill",
+    )
 
 
 class BrowserSettings(BaseSettings):
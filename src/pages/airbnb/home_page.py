@@ -8,7 +8,7 @@ Handles navigation to signup flow.
 
 import asyncio
 
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 
 from src.config.constants import PlatformDomains
 from src.core.base_page import BasePage
@@ -26,15 +26,8 @@ class AirbnbHomePage(BasePage):
     # Platform configuration
     PLATFORM_CONFIG = PlatformDomains.AIRBNB
 
-    def __init__(self, page: Page) -> None:
-        """
-        Initialize the home page.
-
-        Args:
-            page: Playwright Page instance.
-        """
-        super().__init__(page)
-        self.selectors = HomePageSelectors
+    # Selectors are shared by every instance; construction only binds the page
+    selectors = HomePageSelectors
 
     @property
     def url(self) -> str:
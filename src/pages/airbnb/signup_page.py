@@ -8,11 +8,12 @@ Handles the complete signup process including phone verification.
 Updated: December 2025 to match current Airbnb UI
 """
 
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 
 from src.core.base_page import BasePage
 from src.pages.airbnb.selectors import SignupPageSelectors, OTPSelectors
-from src.types.models import PhoneNumber, UserProfile
+from src.types.models import UserProfile
+from src.types.phone import PhoneNumber
 
 
 class AirbnbSignupPage(BasePage):
@@ -25,11 +26,122 @@ class AirbnbSignupPage(BasePage):
     - Profile completion
     """
 
-    def __init__(self, page: Page) -> None:
-        """Initialize the signup page."""
-        super().__init__(page)
-        self.selectors = SignupPageSelectors
-        self.otp_selectors = OTPSelectors
+    # Selector groups are shared by every instance; construction only binds the page
+    selectors = SignupPageSelectors
+    otp_selectors = OTPSelectors
+
+    # Dial code -> (ISO code, name) for the native country <select>.
+    # Option values use the format {dial_code}{ISO_code}, e.g. "380UA".
+    COUNTRY_SELECT_OPTIONS: dict[str, tuple[str, str]] = {
+        # 3-digit country codes
+        "380": ("UA", "Ukraine"),
+        "375": ("BY", "Belarus"),
+        "261": ("MG", "Madagascar"),
+        "962": ("JO", "Jordan"),
+        "972": ("IL", "Israel"),
+        "855": ("KH", "Cambodia"),
+        "229": ("BJ", "Benin"),
+        "226": ("BF", "Burkina Faso"),
+        "995": ("GE", "Georgia"),
+        "971": ("AE", "United Arab Emirates"),
+        "977": ("NP", "Nepal"),
+        "961": ("LB", "Lebanon"),
+        "998": ("UZ", "Uzbekistan"),
+        "880": ("BD", "Bangladesh"),
+        "234": ("NG", "Nigeria"),
+        "254": ("KE", "Kenya"),
+        "255": ("TZ", "Tanzania"),
+        "256": ("UG", "Uganda"),
+        "212": ("MA", "Morocco"),
+        "213": ("DZ", "Algeria"),
+        "216": ("TN", "Tunisia"),
+        "218": ("LY", "Libya"),
+        "220": ("GM", "Gambia"),
+        "221": ("SN", "Senegal"),
+        "222": ("MR", "Mauritania"),
+        "223": ("ML", "Mali"),
+        "224": ("GN", "Guinea"),
+        "225": ("CI", "Côte d'Ivoire"),
+        "227": ("NE", "Niger"),
+        "228": ("TG", "Togo"),
+        "230": ("MU", "Mauritius"),
+        "231": ("LR", "Liberia"),
+        "232": ("SL", "Sierra Leone"),
+        "233": ("GH", "Ghana"),
+        "237": ("CM", "Cameroon"),
+        "238": ("CV", "Cape Verde"),
+        "239": ("ST", "São Tomé and Príncipe"),
+        "240": ("GQ", "Equatorial Guinea"),
+        "241": ("GA", "Gabon"),
+        "242": ("CG", "Republic of the Congo"),
+        "243": ("CD", "Democratic Republic of the Congo"),
+        "244": ("AO", "Angola"),
+        "245": ("GW", "Guinea-Bissau"),
+        "246": ("IO", "British Indian Ocean Territory"),
+        "247": ("AC", "Ascension Island"),
+        "248": ("SC", "Seychelles"),
+        "249": ("SD", "Sudan"),
+        "250": ("RW", "Rwanda"),
+        "251": ("ET", "Ethiopia"),
+        "252": ("SO", "Somalia"),
+        "253": ("DJ", "Djibouti"),
+        "257": ("BI", "Burundi"),
+        "258": ("MZ", "Mozambique"),
+        "260": ("ZM", "Zambia"),
+        "263": ("ZW", "Zimbabwe"),
+        "264": ("NA", "Namibia"),
+        "265": ("MW", "Malawi"),
+        "266": ("LS", "Lesotho"),
+        "267": ("BW", "Botswana"),
+        "268": ("SZ", "Eswatini"),
+        "269": ("KM", "Comoros"),
+        # 2-digit country codes
+        "53": ("CU", "Cuba"),
+        "1": ("US", "United States"),  # Note: US, CA, and others share +1
+        "92": ("PK", "Pakistan"),
+        "44": ("GB", "United Kingdom"),
+        "49": ("DE", "Germany"),
+        "33": ("FR", "France"),
+        "7": ("RU", "Russia"),
+        "48": ("PL", "Poland"),
+        "91": ("IN", "India"),
+        "86": ("CN", "China"),
+        "81": ("JP", "Japan"),
+        "82": ("KR", "South Korea"),
+        "61": ("AU", "Australia"),
+        "34": ("ES", "Spain"),
+        "39": ("IT", "Italy"),
+        "31": ("NL", "Netherlands"),
+        "65": ("SG", "Singapore"),
+        "20": ("EG", "Egypt"),
+        "27": ("ZA", "South Africa"),
+        "30": ("GR", "Greece"),
+        "32": ("BE", "Belgium"),
+        "36": ("HU", "Hungary"),
+        "40": ("RO", "Romania"),
+        "41": ("CH", "Switzerland"),
+        "43": ("AT", "Austria"),
+        "45": ("DK", "Denmark"),
+        "46": ("SE", "Sweden"),
+        "47": ("NO", "Norway"),
+        "51": ("PE", "Peru"),
+        "52": ("MX", "Mexico"),
+        "54": ("AR", "Argentina"),
+        "55": ("BR", "Brazil"),
+        "56": ("CL", "Chile"),
+        "57": ("CO", "Colombia"),
+        "58": ("VE", "Venezuela"),
+        "60": ("MY", "Malaysia"),
+        "62": ("ID", "Indonesia"),
+        "63": ("PH", "Philippines"),
+        "64": ("NZ", "New Zealand"),
+        "66": ("TH", "Thailand"),
+        "84": ("VN", "Vietnam"),
+        "90": ("TR", "Turkey"),
+        "93": ("AF", "Afghanistan"),
+        "94": ("LK", "Sri Lanka"),
+        "95": ("MM", "Myanmar"),
+    }
 
     @property
     def url(self) -> str:
@@ -143,121 +255,7 @@ class AirbnbSignupPage(BasePage):
         Args:
             country_code: Country code (e.g., "380" for Ukraine).
         """
-        # Map country codes to their ISO codes and names for the native select
-        # Value format: {dial_code}{ISO_2_letter_code}
-        country_map = {
-            # 3-digit country codes
-            "380": ("UA", "Ukraine"),
-            "375": ("BY", "Belarus"),
-            "261": ("MG", "Madagascar"),
-            "962": ("JO", "Jordan"),
-            "972": ("IL", "Israel"),
-            "855": ("KH", "Cambodia"),
-            "229": ("BJ", "Benin"),
-            "226": ("BF", "Burkina Faso"),
-            "995": ("GE", "Georgia"),
-            "971": ("AE", "United Arab Emirates"),
-            "977": ("NP", "Nepal"),
-            "961": ("LB", "Lebanon"),
-            "998": ("UZ", "Uzbekistan"),
-            "880": ("BD", "Bangladesh"),
-            "234": ("NG", "Nigeria"),
-            "254": ("KE", "Kenya"),
-            "255": ("TZ", "Tanzania"),
-            "256": ("UG", "Uganda"),
-            "212": ("MA", "Morocco"),
-            "213": ("DZ", "Algeria"),
-            "216": ("TN", "Tunisia"),
-            "218": ("LY", "Libya"),
-            "220": ("GM", "Gambia"),
-            "221": ("SN", "Senegal"),
-            "222": ("MR", "Mauritania"),
-            "223": ("ML", "Mali"),
-            "224": ("GN", "Guinea"),
-            "225": ("CI", "Côte d'Ivoire"),
-            "227": ("NE", "Niger"),
-            "228": ("TG", "Togo"),
-            "230": ("MU", "Mauritius"),
-            "231": ("LR", "Liberia"),
-            "232": ("SL", "Sierra Leone"),
-            "233": ("GH", "Ghana"),
-            "237": ("CM", "Cameroon"),
-            "238": ("CV", "Cape Verde"),
-            "239": ("ST", "São Tomé and Príncipe"),
-            "240": ("GQ", "Equatorial Guinea"),
-            "241": ("GA", "Gabon"),
-            "242": ("CG", "Republic of the Congo"),
-            "243": ("CD", "Democratic Republic of the Congo"),
-            "244": ("AO", "Angola"),
-            "245": ("GW", "Guinea-Bissau"),
-            "246": ("IO", "British Indian Ocean Territory"),
-            "247": ("AC", "Ascension Island"),
-            "248": ("SC", "Seychelles"),
-            "249": ("SD", "Sudan"),
-            "250": ("RW", "Rwanda"),
-            "251": ("ET", "Ethiopia"),
-            "252": ("SO", "Somalia"),
-            "253": ("DJ", "Djibouti"),
-            "257": ("BI", "Burundi"),
-            "258": ("MZ", "Mozambique"),
-            "260": ("ZM", "Zambia"),
-            "263": ("ZW", "Zimbabwe"),
-            "264": ("NA", "Namibia"),
-            "265": ("MW", "Malawi"),
-            "266": ("LS", "Lesotho"),
-            "267": ("BW", "Botswana"),
-            "268": ("SZ", "Eswatini"),
-            "269": ("KM", "Comoros"),
-            # 2-digit country codes
-            "53": ("CU", "Cuba"),
-            "1": ("US", "United States"),  # Note: US, CA, and others share +1
-            "92": ("PK", "Pakistan"),
-            "44": ("GB", "United Kingdom"),
-            "49": ("DE", "Germany"),
-            "33": ("FR", "France"),
-            "7": ("RU", "Russia"),
-            "48": ("PL", "Poland"),
-            "91": ("IN", "India"),
-            "86": ("CN", "China"),
-            "81": ("JP", "Japan"),
-            "82": ("KR", "South Korea"),
-            "61": ("AU", "Australia"),
-            "34": ("ES", "Spain"),
-            "39": ("IT", "Italy"),
-            "31": ("NL", "Netherlands"),
-            "65": ("SG", "Singapore"),
-            "20": ("EG", "Egypt"),
-            "27": ("ZA", "South Africa"),
-            "30": ("GR", "Greece"),
-            "32": ("BE", "Belgium"),
-            "36": ("HU", "Hungary"),
-            "40": ("RO", "Romania"),
-            "41": ("CH", "Switzerland"),
-            "43": ("AT", "Austria"),
-            "45": ("DK", "Denmark"),
-            "46": ("SE", "Sweden"),
-            "47": ("NO", "Norway"),
-            "51": ("PE", "Peru"),
-            "52": ("MX", "Mexico"),
-            "54": ("AR", "Argentina"),
-            "55": ("BR", "Brazil"),
-            "56": ("CL", "Chile"),
-            "57": ("CO", "Colombia"),
-            "58": ("VE", "Venezuela"),
-            "60": ("MY", "Malaysia"),
-            "62": ("ID", "Indonesia"),
-            "63": ("PH", "Philippines"),
-            "64": ("NZ", "New Zealand"),
-            "66": ("TH", "Thailand"),
-            "84": ("VN", "Vietnam"),
-            "90": ("TR", "Turkey"),
-            "93": ("AF", "Afghanistan"),
-            "94": ("LK", "Sri Lanka"),
-            "95": ("MM", "Myanmar"),
-            "92": ("PK", "Pakistan"),
-        }
-
-        country_info = country_map.get(country_code)
+        country_info = self.COUNTRY_SELECT_OPTIONS.get(country_code)
         if not country_info:
             self.log.warning(f"Unknown country code: {country_code}, skipping selection")
             return
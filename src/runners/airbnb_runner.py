@@ -16,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.config import get_settings
 from src.services.signup_orchestrator import SignupOrchestrator
 from src.types.enums import Platform
-from src.utils.data_generator import DataGenerator
+from src.utils.data_generator import get_data_generator
 from src.utils.logger import setup_logger, get_logger
 from src.utils.phone_manager import PhoneManager
 
@@ -87,48 +87,51 @@ async def run_single_signup(use_manual_otp: bool = False) -> None:
     )
     await phone_manager.load()
 
-    # Log phone stats
-    stats = phone_manager.get_stats()
-    logger.info(f"Phone stats: {stats['available']} available, {stats['success']} success, {stats['failed']} failed")
+    try:
+        # Log phone stats
+        stats = phone_manager.get_stats()
+        logger.info(f"Phone stats: {stats['available']} available, {stats['success']} success, {stats['failed']} failed")
 
-    if stats['available'] == 0:
-        logger.error("No available phone numbers. Exiting.")
-        return
+        if stats['available'] == 0:
+            logger.error("No available phone numbers. Exiting.")
+            return
 
-    # Initialize data generator
-    data_generator = DataGenerator()
+        # Get shared data generator
+        data_generator = get_data_generator()
 
-    # Initialize orchestrator
-    orchestrator = SignupOrchestrator(
-        platform=Platform.AIRBNB,
-        phone_manager=phone_manager,
-        data_generator=data_generator,
-    )
+        # Initialize orchestrator
+        orchestrator = SignupOrchestrator(
+            platform=Platform.AIRBNB,
+            phone_manager=phone_manager,
+            data_generator=data_generator,
+        )
 
-    # Run signup - use manual OTP callback only if explicitly requested
-    otp_cb = manual_otp_callback if use_manual_otp else None
-    result = await orchestrator.run_single_signup(
-        otp_callback=otp_cb
-    )
+        # Run signup - use manual OTP callback only if explicitly requested
+        otp_cb = manual_otp_callback if use_manual_otp else None
+        result = await orchestrator.run_single_signup(
+            otp_callback=otp_cb
+        )
 
-    # Report result
-    print(f"\n{'='*50}")
-    print("SIGNUP RESULT")
-    print(f"{'='*50}")
-    print(f"Success: {result.success}")
-    print(f"Platform: {result.platform}")
-    print(f"Step Reached: {result.step_reached}")
-    print(f"Duration: {result.duration_seconds:.2f} seconds")
+        # Report result
+        print(f"\n{'='*50}")
+        print("SIGNUP RESULT")
+        print(f"{'='*50}")
+        print(f"Success: {result.success}")
+        print(f"Platform: {result.platform}")
+        print(f"Step Reached: {result.step_reached}")
+        print(f"Duration: {result.duration_seconds:.2f} seconds")
 
-    if result.success and result.account:
-        print(f"\nAccount Created:")
-        print(f"  Email: {result.account.email}")
-        print(f"  Phone: {result.account.phone}")
-        print(f"  Name: {result.account.profile.full_name}")
-    elif result.error_message:
-        print(f"\nError: {result.error_message}")
+        if result.success and result.account:
+            print(f"\nAccount Created:")
+            print(f"  Email: {result.account.email}")
+            print(f"  Phone: {result.account.phone}")
+            print(f"  Name: {result.account.profile.full_name}")
+        elif result.error_message:
+            print(f"\nError: {result.error_message}")
 
-    print(f"{'='*50}\n")
+        print(f"{'='*50}\n")
+    finally:
+        phone_manager.close()
 
 
 async def run_continuous_loop(delay_between: int = 0) -> None:
@@ -165,112 +168,116 @@ async def run_continuous_loop(delay_between: int = 0) -> None:
     )
     await phone_manager.load()
 
-    # Get initial stats
-    stats = phone_manager.get_stats()
-    total_available = stats['available']
+    try:
+        # Get initial stats
+        stats = phone_manager.get_stats()
+        total_available = stats['available']
 
-    if total_available == 0:
-        logger.error("No available phone numbers. Exiting.")
-        return
+        if total_available == 0:
+            logger.error("No available phone numbers. Exiting.")
+            return
 
-    print(f"Starting with {total_available} available phone numbers\n")
+        print(f"Starting with {total_available} available phone numbers\n")
 
-    # Track results
-    success_count = 0
-    fail_count = 0
-    attempt = 0
+        # Track results
+        success_count = 0
+        fail_count = 0
+        attempt = 0
 
-    # Run until no more phones available
-    while True:
-        # Re-check available count (file may have been modified)
-        remaining = phone_manager.available_count
+        # Run until no more phones available
+        while True:
+            # Re-check available count (file may have been modified)
+            phone_manager.refresh()
+            remaining = phone_manager.available_count
 
-        if remaining == 0:
-            print(f"\n{'='*60}")
-            print("ALL PHONE NUMBERS PROCESSED")
-            print(f"{'='*60}")
-            break
-
-        attempt += 1
-
-        # Show which phone will be processed next
-        next_phone = phone_manager.get_next()
-        if not next_phone:
-            print(f"\n{'='*60}")
-            print("NO MORE PHONES AVAILABLE")
-            print(f"{'='*60}")
-            break
-
-        print(f"\n{'='*60}")
-        print(f"ATTEMPT {attempt} | {remaining} phones remaining")
-        print(f"Next phone: {next_phone.formatted}")
-        print(f"Success: {success_count} | Failed: {fail_count}")
-        print(f"{'='*60}\n")
+            if remaining == 0:
+                print(f"\n{'='*60}")
+                print("ALL PHONE NUMBERS PROCESSED")
+                print(f"{'='*60}")
+                break
 
-        # Initialize fresh data generator for each attempt
-        data_generator = DataGenerator()
+            attempt += 1
 
-        # Initialize fresh orchestrator for each attempt
-        # Each signup will create a new MLX profile automatically
-        orchestrator = SignupOrchestrator(
-            platform=Platform.AIRBNB,
-            phone_manager=phone_manager,
-            data_generator=data_generator,
-        )
+            # Show which phone will be processed next
+            next_phone = phone_manager.get_next()
+            if not next_phone:
+                print(f"\n{'='*60}")
+                print("NO MORE PHONES AVAILABLE")
+                print(f"{'='*60}")
+                break
 
-        try:
-            # Run single signup (creates new MLX profile, runs, closes)
-            # No OTP automation - but we check if OTP screen appears:
-            #   - OTP screen appears = SUCCESS (phone is valid, SMS sent)
-            #   - No OTP screen (captcha/error) = FAILED (phone rejected)
-            result = await orchestrator.run_single_signup(
-                otp_callback=None  # No OTP automation - just verify phone validity
+            print(f"\n{'='*60}")
+            print(f"ATTEMPT {attempt} | {remaining} phones remaining")
+            print(f"Next phone: {next_phone.formatted}")
+            print(f"Success: {success_count} | Failed: {fail_count}")
+            print(f"{'='*60}\n")
+
+            # Shared data generator (holds no per-attempt state)
+            data_generator = get_data_generator()
+
+            # Initialize fresh orchestrator for each attempt
+            # Each signup will create a new MLX profile automatically
+            orchestrator = SignupOrchestrator(
+                platform=Platform.AIRBNB,
+                phone_manager=phone_manager,
+                data_generator=data_generator,
             )
 
-            if result.success:
-                success_count += 1
-                print(f"\n✓ SUCCESS #{success_count} - OTP SENT!")
-                print(f"  Phone verified: OTP screen appeared")
-                print(f"  (Phone number is valid, SMS was sent)")
-                if result.account:
-                    print(f"  Email: {result.account.email}")
-                    print(f"  Phone: {result.account.phone}")
-            else:
+            try:
+                # Run single signup (creates new MLX profile, runs, closes)
+                # No OTP automation - but we check if OTP screen appears:
+                #   - OTP screen appears = SUCCESS (phone is valid, SMS sent)
+                #   - No OTP screen (captcha/error) = FAILED (phone rejected)
+                result = await orchestrator.run_single_signup(
+                    otp_callback=None  # No OTP automation - just verify phone validity
+                )
+
+                if result.success:
+                    success_count += 1
+                    print(f"\n✓ SUCCESS #{success_count} - OTP SENT!")
+                    print(f"  Phone verified: OTP screen appeared")
+                    print(f"  (Phone number is valid, SMS was sent)")
+                    if result.account:
+                        print(f"  Email: {result.account.email}")
+                        print(f"  Phone: {result.account.phone}")
+                else:
+                    fail_count += 1
+                    print(f"\n✗ FAILED #{fail_count} - NO OTP")
+                    print(f"  Error: {result.error_message}")
+                    print(f"  (Captcha, rate limit, or phone rejected)")
+                    print(f"  Step: {result.step_reached}")
+
+            except KeyboardInterrupt:
+                print("\n\nInterrupted by user!")
+                break
+
+            except Exception as e:
                 fail_count += 1
-                print(f"\n✗ FAILED #{fail_count} - NO OTP")
-                print(f"  Error: {result.error_message}")
-                print(f"  (Captcha, rate limit, or phone rejected)")
-                print(f"  Step: {result.step_reached}")
+                logger.exception(f"Unexpected error during signup: {e}")
+                print(f"\n✗ FAILED #{fail_count} (exception)")
+                print(f"  Error: {e}")
+                # Don't break - continue to next phone
+                print("  Continuing to next phone...")
 
-        except KeyboardInterrupt:
-            print("\n\nInterrupted by user!")
-            break
+            # Continue immediately to next phone (no delay)
 
-        except Exception as e:
-            fail_count += 1
-            logger.exception(f"Unexpected error during signup: {e}")
-            print(f"\n✗ FAILED #{fail_count} (exception)")
-            print(f"  Error: {e}")
-            # Don't break - continue to next phone
-            print("  Continuing to next phone...")
+        # Final summary
+        total_processed = success_count + fail_count
+        success_rate = (success_count / total_processed * 100) if total_processed > 0 else 0
 
-        # Continue immediately to next phone (no delay)
-
-    # Final summary
-    total_processed = success_count + fail_count
-    success_rate = (success_count / total_processed * 100) if total_processed > 0 else 0
-
-    print(f"\n{'='*60}")
-    print("FINAL SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total Attempts: {total_processed}")
-    print(f"OTP Sent (valid phones): {success_count}")
-    print(f"Failed (captcha/rejected): {fail_count}")
-    print(f"Success Rate: {success_rate:.1f}%")
-    print(f"\nResults saved to:")
-    print(f"  Valid phones (OTP sent): data/success.txt")
-    print(f"  Failed phones: data/failed.txt")
-    print(f"{'='*60}\n")
+        print(f"\n{'='*60}")
+        print("FINAL SUMMARY")
+        print(f"{'='*60}")
+        print(f"Total Attempts: {total_processed}")
+        print(f"OTP Sent (valid phones): {success_count}")
+        print(f"Failed (captcha/rejected): {fail_count}")
+        print(f"Success Rate: {success_rate:.1f}%")
+        print(f"\nResults saved to:")
+        print(f"  Valid phones (OTP sent): data/success.txt")
+        print(f"  Failed phones: data/failed.txt")
+        print(f"{'='*60}\n")
+    finally:
+        phone_manager.close()
 
 
 async def run_all_phones(delay_between: int = 0) -> None:
@@ -304,62 +311,65 @@ async def run_batch_signup(count: int = 5) -> None:
     )
     await phone_manager.load()
 
-    # Check we have enough phones
-    if phone_manager.available_count < count:
-        logger.warning(
-            f"Only {phone_manager.available_count} phones available "
-            f"for {count} signups"
-        )
-        count = phone_manager.available_count
-
-    if count == 0:
-        logger.error("No available phone numbers. Exiting.")
-        return
-
-    results = []
-    for i in range(count):
-        print(f"\n{'='*50}")
-        print(f"BATCH SIGNUP {i + 1}/{count}")
-        print(f"{'='*50}")
-
-        # Fresh orchestrator for each attempt
-        orchestrator = SignupOrchestrator(
-            platform=Platform.AIRBNB,
-            phone_manager=phone_manager,
-        )
+    try:
+        # Check we have enough phones
+        if phone_manager.available_count < count:
+            logger.warning(
+                f"Only {phone_manager.available_count} phones available "
+                f"for {count} signups"
+            )
+            count = phone_manager.available_count
+
+        if count == 0:
+            logger.error("No available phone numbers. Exiting.")
+            return
+
+        results = []
+        for i in range(count):
+            print(f"\n{'='*50}")
+            print(f"BATCH SIGNUP {i + 1}/{count}")
+            print(f"{'='*50}")
+
+            # Fresh orchestrator for each attempt
+            orchestrator = SignupOrchestrator(
+                platform=Platform.AIRBNB,
+                phone_manager=phone_manager,
+            )
 
-        result = await orchestrator.run_single_signup(
-            otp_callback=manual_otp_callback,
-        )
-        results.append(result)
+            result = await orchestrator.run_single_signup(
+                otp_callback=manual_otp_callback,
+            )
+            results.append(result)
 
-        # Continue immediately to next attempt (no delay)
+            # Continue immediately to next attempt (no delay)
 
-    # Summary
-    successes = sum(1 for r in results if r.success)
-    failures = count - successes
+        # Summary
+        successes = sum(1 for r in results if r.success)
+        failures = count - successes
 
-    print(f"\n{'='*50}")
-    print("BATCH SIGNUP SUMMARY")
-    print(f"{'='*50}")
-    print(f"Total Attempts: {count}")
-    print(f"Successful: {successes}")
-    print(f"Failed: {failures}")
-    print(f"Success Rate: {(successes/count)*100:.1f}%")
-
-    if successes > 0:
-        print(f"\nSuccessful Accounts:")
-        for i, result in enumerate(results):
-            if result.success and result.account:
-                print(f"  {i+1}. {result.account.email} ({result.account.phone})")
-
-    if failures > 0:
-        print(f"\nFailed Attempts:")
-        for i, result in enumerate(results):
-            if not result.success:
-                print(f"  {i+1}. Step: {result.step_reached}, Error: {result.error_message}")
-
-    print(f"{'='*50}\n")
+        print(f"\n{'='*50}")
+        print("BATCH SIGNUP SUMMARY")
+        print(f"{'='*50}")
+        print(f"Total Attempts: {count}")
+        print(f"Successful: {successes}")
+        print(f"Failed: {failures}")
+        print(f"Success Rate: {(successes/count)*100:.1f}%")
+
+        if successes > 0:
+            print(f"\nSuccessful Accounts:")
+            for i, result in enumerate(results):
+                if result.success and result.account:
+                    print(f"  {i+1}. {result.account.email} ({result.account.phone})")
+
+        if failures > 0:
+            print(f"\nFailed Attempts:")
+            for i, result in enumerate(results):
+                if not result.success:
+                    print(f"  {i+1}. Step: {result.step_reached}, Error: {result.error_message}")
+
+        print(f"{'='*50}\n")
+    finally:
+        phone_manager.close()
 
 
 def main():
@@ -22,7 +22,7 @@ from src.core.browser_manager import BrowserManager
 from src.pages.airbnb.home_page import AirbnbHomePage
 from src.pages.airbnb.signup_page import AirbnbSignupPage
 from src.types.enums import Platform
-from src.types.models import PhoneNumber
+from src.types.phone import PhoneNumber
 from src.utils.data_generator import DataGenerator
 from src.utils.logger import setup_logger, get_logger
 from src.utils.phone_manager import PhoneManager
@@ -70,6 +70,7 @@ class BatchPhoneTester:
 
         self.results: List[PhoneTestResult] = []
         self._http_response_code: Optional[int] = None
+        self._results_header_written = False
 
     def _load_phone_numbers(self) -> List[str]:
         """Load phone numbers from file."""
@@ -203,28 +204,37 @@ class BatchPhoneTester:
         finally:
             await browser_manager.stop()
 
-    def _save_results(self) -> None:
-        """Save results to CSV file."""
-        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+    def _save_result(self, r: PhoneTestResult) -> None:
+        """
+        Append one result row to the CSV file.
 
-        with open(self.results_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'phone_number', 'country', 'accepted', 'otp_screen_shown',
-                'error_code', 'error_message', 'duration_seconds', 'timestamp'
-            ])
+        The first call of a run truncates the file and writes the header,
+        so the file always holds exactly this run's results.
+        """
+        if not self._results_header_written:
+            self.results_path.parent.mkdir(parents=True, exist_ok=True)
 
-            for r in self.results:
+        # csv.writer is kept for quoting: error messages may contain commas
+        mode = 'a' if self._results_header_written else 'w'
+        with open(self.results_path, mode, newline='') as f:
+            writer = csv.writer(f)
+            if not self._results_header_written:
                 writer.writerow([
-                    r.phone_number,
-                    r.country,
-                    r.accepted,
-                    r.otp_screen_shown,
-                    r.error_code or '',
-                    r.error_message or '',
-                    f"{r.duration_seconds:.2f}",
-                    r.timestamp,
+                    'phone_number', 'country', 'accepted', 'otp_screen_shown',
+                    'error_code', 'error_message', 'duration_seconds', 'timestamp'
                 ])
+                self._results_header_written = True
+
+            writer.writerow([
+                r.phone_number,
+                r.country,
+                r.accepted,
+                r.otp_screen_shown,
+                r.error_code or '',
+                r.error_message or '',
+                f"{r.duration_seconds:.2f}",
+                r.timestamp,
+            ])
 
         self.log.info(f"Results saved to: {self.results_path}")
 
@@ -286,8 +296,8 @@ class BatchPhoneTester:
             result = await self._test_single_phone(phone, browser_manager)
             self.results.append(result)
 
-            # Save results after each test (in case of crash)
-            self._save_results()
+            # Save each result as it completes (in case of crash)
+            self._save_result(result)
 
             # Delay between tests
             if i < len(phone_numbers):
@@ -5,11 +5,11 @@ Account Saver Service
 Handles saving and managing created account credentials.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 
 import aiofiles
+import orjson
 
 from src.types.enums import Platform
 from src.types.models import AccountCredentials
@@ -77,16 +77,16 @@ class AccountSaver(LoggerMixin):
             return []
 
         try:
-            async with aiofiles.open(file_path, "r") as f:
+            async with aiofiles.open(file_path, "rb") as f:
                 content = await f.read()
-                return json.loads(content)
-        except (json.JSONDecodeError, FileNotFoundError):
+                return orjson.loads(content)
+        except (orjson.JSONDecodeError, FileNotFoundError):
             return []
 
     async def _save_to_file(self, file_path: Path, accounts: list[dict]) -> None:
         """Save accounts to file."""
-        async with aiofiles.open(file_path, "w") as f:
-            await f.write(json.dumps(accounts, indent=2))
+        async with aiofiles.open(file_path, "wb") as f:
+            await f.write(orjson.dumps(accounts, option=orjson.OPT_INDENT_2))
 
     async def get_accounts(self, platform: Platform) -> list[dict]:
         """
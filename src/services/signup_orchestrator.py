@@ -8,6 +8,7 @@ Includes comprehensive debug logging and screenshot capture.
 """
 
 import asyncio
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 from typing import Callable
@@ -25,16 +26,25 @@ from src.core.browser_manager import BrowserManager
 from src.pages.airbnb import AirbnbHomePage, AirbnbSignupPage
 from src.services.account_saver import AccountSaver
 from src.types.enums import AccountStatus, Platform, SignupStep
-from src.types.models import (
-    AccountCredentials,
-    PhoneNumber,
-    SignupResult,
-    UserProfile,
-)
-from src.utils.data_generator import DataGenerator
+from src.types.models import AccountCredentials, SignupResult, UserProfile
+from src.types.phone import PhoneNumber
+from src.utils.data_generator import DataGenerator, get_data_generator
 from src.utils.logger import LoggerMixin
 from src.utils.phone_manager import PhoneManager
 
+# Per-attempt state. asyncio tasks copy the current context, so concurrent
+# signups each see their own step/phone/screenshot directory.
+_CURRENT_STEP: ContextVar[SignupStep] = ContextVar(
+    "_current_step", default=SignupStep.INITIALIZED
+)
+_CURRENT_PHONE: ContextVar[str | None] = ContextVar("_current_phone", default=None)
+_SCREENSHOT_DIR: ContextVar[Path | None] = ContextVar("_screenshot_dir", default=None)
+
+# Collects every page-state field in a single CDP round-trip
+_PAGE_STATE_JS = (
+    "() => ({url: location.href, title: document.title, ready: document.readyState})"
+)
+
 
 class SignupOrchestrator(LoggerMixin):
     """
@@ -68,12 +78,12 @@ class SignupOrchestrator(LoggerMixin):
         Args:
             platform: Target platform for signups.
             phone_manager: Manager for phone numbers.
-            data_generator: Optional data generator (creates default if None).
+            data_generator: Optional data generator (uses the shared default if None).
             account_saver: Optional account saver (creates default if None).
         """
         self.platform = platform
         self.phone_manager = phone_manager
-        self.data_generator = data_generator or DataGenerator()
+        self.data_generator = data_generator or get_data_generator()
 
         settings = get_settings()
         self.account_saver = account_saver or AccountSaver(
@@ -81,13 +91,25 @@ class SignupOrchestrator(LoggerMixin):
         )
 
         self._browser_manager: BrowserManager | None = None
-        self._current_step = SignupStep.INITIALIZED
-        self._current_phone: str | None = None
 
         # Base screenshot directory
         self.screenshot_base_dir = Path("./screenshots")
         self.screenshot_base_dir.mkdir(parents=True, exist_ok=True)
-        self.screenshot_dir = self.screenshot_base_dir
+
+    @property
+    def _current_step(self) -> SignupStep:
+        """Get the step reached by the signup running in the current context."""
+        return _CURRENT_STEP.get()
+
+    @property
+    def _current_phone(self) -> str | None:
+        """Get the phone number used by the signup in the current context."""
+        return _CURRENT_PHONE.get()
+
+    @property
+    def screenshot_dir(self) -> Path:
+        """Get the screenshot directory for the signup in the current context."""
+        return _SCREENSHOT_DIR.get() or self.screenshot_base_dir
 
     async def _take_screenshot(self, page: Page, step_name: str) -> None:
         """Take a debug screenshot for the current step."""
@@ -103,11 +125,11 @@ class SignupOrchestrator(LoggerMixin):
     async def _log_page_state(self, page: Page, description: str) -> None:
         """Log the current page state for debugging."""
         try:
-            url = page.url
-            title = await page.title()
-            self.log.info(f"[PAGE STATE] {description}")
-            self.log.info(f"  URL: {url}")
-            self.log.info(f"  Title: {title}")
+            state = await page.evaluate(_PAGE_STATE_JS)
+            self.log.info("[PAGE STATE] {}", description)
+            self.log.info("  URL: {}", state["url"])
+            self.log.info("  Title: {}", state["title"])
+            self.log.info("  Ready state: {}", state["ready"])
         except Exception as e:
             self.log.warning(f"Failed to log page state: {e}")
 
@@ -133,6 +155,10 @@ class SignupOrchestrator(LoggerMixin):
         self.log.info("STARTING NEW SIGNUP ATTEMPT")
         self.log.info("=" * 70)
 
+        _CURRENT_STEP.set(SignupStep.INITIALIZED)
+        _CURRENT_PHONE.set(None)
+        _SCREENSHOT_DIR.set(None)
+
         try:
             # Get phone number
             phone = self.phone_manager.get_next()
@@ -150,10 +176,11 @@ class SignupOrchestrator(LoggerMixin):
             self.log.info(f"  Local number: {phone.local_number}")
 
             # Create phone-specific screenshot directory
-            self._current_phone = phone.number
-            self.screenshot_dir = self.screenshot_base_dir / phone.number
-            self.screenshot_dir.mkdir(parents=True, exist_ok=True)
-            self.log.info(f"  Screenshots: {self.screenshot_dir}")
+            screenshot_dir = self.screenshot_base_dir / phone.number
+            screenshot_dir.mkdir(parents=True, exist_ok=True)
+            _CURRENT_PHONE.set(phone.number)
+            _SCREENSHOT_DIR.set(screenshot_dir)
+            self.log.info(f"  Screenshots: {screenshot_dir}")
 
             # Generate profile
             profile = self.data_generator.generate_profile()
@@ -165,7 +192,7 @@ class SignupOrchestrator(LoggerMixin):
                 self.log.info(f"  Birth date: {profile.birth_date.strftime('%Y-%m-%d')}")
 
             # Run the platform-specific signup
-            if self.platform == Platform.AIRBNB:
+            if self.platform is Platform.AIRBNB:
                 result = await self._run_airbnb_signup(
                     phone=phone,
                     profile=profile,
@@ -240,7 +267,7 @@ class SignupOrchestrator(LoggerMixin):
                 self.log.info("-" * 60)
                 self.log.info("STEP 1: Navigating to Signup")
                 self.log.info("-" * 60)
-                self._current_step = SignupStep.INITIALIZED
+                _CURRENT_STEP.set(SignupStep.INITIALIZED)
 
                 # Uses direct URL or modal flow based on config
                 await home_page.navigate_to_signup()
@@ -254,7 +281,7 @@ class SignupOrchestrator(LoggerMixin):
                 await page.wait_for_timeout(2000)
                 await self._take_screenshot(page, "02_after_popups")
 
-                self._current_step = SignupStep.NAVIGATED_TO_SIGNUP
+                _CURRENT_STEP.set(SignupStep.NAVIGATED_TO_SIGNUP)
 
                 # ============================================================
                 # STEP 2: Wait for signup form and select phone method
@@ -292,7 +319,7 @@ class SignupOrchestrator(LoggerMixin):
                 self.log.info("-" * 60)
                 self.log.info("STEP 3: Entering phone number")
                 self.log.info("-" * 60)
-                self._current_step = SignupStep.PHONE_ENTERED
+                _CURRENT_STEP.set(SignupStep.PHONE_ENTERED)
 
                 self.log.info(f"Entering phone: {phone.formatted}")
                 await signup_page.enter_phone_number(phone)
@@ -323,7 +350,7 @@ class SignupOrchestrator(LoggerMixin):
                 self.log.info("-" * 60)
                 self.log.info("STEP 4: Waiting for OTP verification screen")
                 self.log.info("-" * 60)
-                self._current_step = SignupStep.OTP_REQUESTED
+                _CURRENT_STEP.set(SignupStep.OTP_REQUESTED)
 
                 otp_screen_appeared = await signup_page.wait_for_otp_screen()
                 await self._take_screenshot(page, "08_otp_screen")
@@ -361,7 +388,7 @@ class SignupOrchestrator(LoggerMixin):
                 self.log.info("SMS was sent successfully - marking as SUCCESS")
                 self.log.info("=" * 50)
 
-                self._current_step = SignupStep.OTP_REQUESTED
+                _CURRENT_STEP.set(SignupStep.OTP_REQUESTED)
                 await self._take_screenshot(page, "08_otp_success_phone_valid")
 
                 # If we have OTP automation, continue with the flow
@@ -379,7 +406,7 @@ class SignupOrchestrator(LoggerMixin):
                         await signup_page.enter_otp(otp_code)
                         await self._take_screenshot(page, "09_otp_entered")
                         await signup_page.click_verify()
-                        self._current_step = SignupStep.OTP_VERIFIED
+                        _CURRENT_STEP.set(SignupStep.OTP_VERIFIED)
                         await page.wait_for_timeout(3000)
                         await self._take_screenshot(page, "10_after_otp_verify")
                     else:
@@ -412,7 +439,7 @@ class SignupOrchestrator(LoggerMixin):
                 self.log.info("-" * 60)
                 self.log.info("STEP 6: Filling profile form")
                 self.log.info("-" * 60)
-                self._current_step = SignupStep.PROFILE_COMPLETED
+                _CURRENT_STEP.set(SignupStep.PROFILE_COMPLETED)
 
                 if await signup_page.wait_for_profile_form():
                     self.log.info("Profile form detected - filling...")
@@ -438,7 +465,7 @@ class SignupOrchestrator(LoggerMixin):
                 await self._take_screenshot(page, "14_final_state")
 
                 if await signup_page.is_signup_successful():
-                    self._current_step = SignupStep.SIGNUP_COMPLETED
+                    _CURRENT_STEP.set(SignupStep.SIGNUP_COMPLETED)
                     self.log.info("=" * 50)
                     self.log.info("SIGNUP SUCCESSFUL!")
                     self.log.info("=" * 50)
@@ -507,11 +534,11 @@ class SignupOrchestrator(LoggerMixin):
         )
 
         self.log.info("-" * 60)
-        self.log.info(f"RESULT: {'SUCCESS' if success else 'FAILED'}")
-        self.log.info(f"  Step reached: {step}")
-        self.log.info(f"  Duration: {duration:.2f}s")
+        self.log.info("RESULT: {}", "SUCCESS" if success else "FAILED")
+        self.log.info("  Step reached: {}", step)
+        self.log.info("  Duration: {:.2f}s", duration)
         if error:
-            self.log.info(f"  Error: {error}")
+            self.log.info("  Error: {}", error)
         self.log.info("-" * 60)
 
         return result
@@ -9,11 +9,11 @@ throughout the application.
 from src.types.enums import AccountStatus, Platform, SignupStep
 from src.types.models import (
     AccountCredentials,
-    PhoneNumber,
     ProxyConfig,
     SignupResult,
     UserProfile,
 )
+from src.types.phone import PhoneNumber
 
 __all__ = [
     "Platform",
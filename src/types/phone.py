@@ -0,0 +1,150 @@
+"""
+Phone Number Type
+=================
+
+Lightweight ``__slots__`` dataclass for phone numbers, plus the digit
+cleaning and country-code split helpers it is built on. Phone numbers
+are created in bulk when a phone list is loaded, so this type skips
+per-instance validation machinery.
+"""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.types.enums import Platform
+
+# Every byte except ASCII 0-9, deleted via bytes.translate on the ASCII fast path
+_NON_DIGITS_ASCII = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
+# Matches runs of non-digit characters; fallback for non-ASCII input
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# Known country dialing codes, bucketed by length for O(1) prefix lookup
+_CC_LEN3 = frozenset({
+    "380",  # Ukraine
+    "375",  # Belarus
+    "261",  # Madagascar
+    "962",  # Jordan
+    "972",  # Israel
+    "855",  # Cambodia
+    "229",  # Benin
+    "995",  # Georgia
+    "971",  # UAE
+    "977",  # Nepal
+})
+_CC_LEN2 = frozenset({
+    "53",  # Cuba
+    "44",  # UK
+    "49",  # Germany
+    "33",  # France
+    "39",  # Italy
+    "34",  # Spain
+    "91",  # India
+    "92",  # Pakistan
+    "86",  # China
+    "81",  # Japan
+    "82",  # South Korea
+    "61",  # Australia
+    "55",  # Brazil
+    "52",  # Mexico
+    "27",  # South Africa
+    "20",  # Egypt
+    "90",  # Turkey
+    "62",  # Indonesia
+    "63",  # Philippines
+    "66",  # Thailand
+    "84",  # Vietnam
+    "60",  # Malaysia
+    "65",  # Singapore
+})
+_CC_LEN1 = frozenset({
+    "1",  # US/Canada
+})
+
+# Canonical interned instance of every known code. Phones store these
+# shared objects instead of fresh prefix slices. Probing with n[:3], n[:2],
+# n[:1] in that order still yields the longest matching code.
+_CC_CANON = {code: sys.intern(code) for code in _CC_LEN3 | _CC_LEN2 | _CC_LEN1}
+
+
+def digits_only(value: str) -> str:
+    """
+    Strip every non-digit character from a phone number string.
+
+    Args:
+        value: Phone number as read from a file or user input.
+
+    Returns:
+        The digits of the number, in order.
+    """
+    if value.isascii():
+        return value.encode("ascii").translate(None, _NON_DIGITS_ASCII).decode("ascii")
+    return _NON_DIGIT_RE.sub("", value)
+
+
+def split_country(number: str) -> tuple[str, str]:
+    """
+    Split a digits-only number into (country_code, local_number).
+
+    Args:
+        number: Phone number digits including the country code.
+
+    Returns:
+        The longest known dialing code and the rest of the number, or
+        ("", "") when no known code prefixes the number.
+    """
+    get = _CC_CANON.get
+    cc = get(number[:3]) or get(number[:2]) or get(number[:1])
+    if cc:
+        return cc, number[len(cc):]
+    return "", ""
+
+
+@dataclass(slots=True)
+class PhoneNumber:
+    """
+    Represents a phone number with metadata.
+
+    The number is cleaned to digits on construction and, unless a
+    country code is given, the longest known dialing code is split off.
+
+    Attributes:
+        number: The full phone number including country code.
+        country_code: The country dialing code (e.g., "380" for Ukraine).
+        local_number: The local portion of the phone number.
+        platform: The platform this number is designated for.
+        used_at: Timestamp when the number was used (None if unused).
+    """
+
+    number: str
+    country_code: str = ""
+    local_number: str = ""
+    platform: Platform | None = None
+    used_at: datetime | None = None
+
+    # Rendered once in __post_init__; read on every log line
+    formatted: str = field(init=False, repr=False, compare=False)
+    display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Normalize the number and precompute the display strings."""
+        if not self.number:
+            raise ValueError("Phone number cannot be empty")
+
+        # Interned so set probes against processed numbers match by identity
+        self.number = sys.intern(digits_only(self.number))
+        if not self.country_code:
+            self.country_code, self.local_number = split_country(self.number)
+
+        self.formatted = f"+{self.number}"
+        if self.country_code and self.local_number:
+            self.display = f"+{self.country_code} {self.local_number}"
+        else:
+            self.display = self.formatted
+
+    @property
+    def is_used(self) -> bool:
+        """Check whether this number has been used for signup."""
+        return self.used_at is not None
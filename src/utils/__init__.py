@@ -6,12 +6,13 @@ Common utility functions and helper classes used throughout
 the application.
 """
 
-from src.utils.data_generator import DataGenerator
+from src.utils.data_generator import DataGenerator, get_data_generator
 from src.utils.logger import setup_logger, get_logger
 from src.utils.phone_manager import PhoneManager
 
 __all__ = [
     "DataGenerator",
+    "get_data_generator",
     "PhoneManager",
     "setup_logger",
     "get_logger",
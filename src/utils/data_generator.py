@@ -8,13 +8,59 @@ using the Faker library.
 
 import random
 import string
-from datetime import datetime, timedelta
-
-from faker import Faker
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING
 
 from src.types.models import UserProfile
 from src.utils.logger import LoggerMixin
 
+if TYPE_CHECKING:
+    from faker import Faker
+
+# Every byte except ASCII letters, digits and ".", deleted from email local parts
+_EMAIL_LOCAL_STRIP = bytes(
+    c for c in range(256) if not (c < 128 and (chr(c).isalnum() or c == 0x2E))
+)
+
+
+@lru_cache(maxsize=16)
+def _get_faker(locale: str) -> "Faker":
+    """
+    Get the shared Faker instance for a locale.
+
+    Building a Faker loads its provider modules, so generators for the
+    same locale share one instance. Faker.seed() seeds the shared random
+    source, so seeding behaves the same as with separate instances.
+
+    Args:
+        locale: Faker locale (e.g., "en_US").
+
+    Returns:
+        Faker instance for the locale.
+    """
+    # Imported here so fingerprint-only callers never load Faker's providers
+    from faker import Faker
+
+    return Faker(locale)
+
+
+@lru_cache(maxsize=1)
+def _en_us_name_tables() -> tuple[tuple, tuple]:
+    """
+    Get Faker's weighted en_US name lists flattened for random.choices.
+
+    Returns:
+        ((first_names, cum_weights), (last_names, cum_weights)).
+    """
+    from faker.providers.person.en_US import Provider
+
+    return (
+        (tuple(Provider.first_names), tuple(accumulate(Provider.first_names.values()))),
+        (tuple(Provider.last_names), tuple(accumulate(Provider.last_names.values()))),
+    )
+
 
 class DataGenerator(LoggerMixin):
     """
@@ -29,14 +75,18 @@ class DataGenerator(LoggerMixin):
     """
 
     # Common email domains for generated addresses
-    DEFAULT_EMAIL_DOMAINS = [
+    DEFAULT_EMAIL_DOMAINS = (
         "gmail.com",
         "yahoo.com",
         "outlook.com",
         "hotmail.com",
         "protonmail.com",
         "icloud.com",
-    ]
+    )
+
+    # Password character sets
+    _PASSWORD_SPECIALS = "!@#$%&*"
+    _PASSWORD_ALPHABET = string.ascii_letters + string.digits + _PASSWORD_SPECIALS
 
     def __init__(
         self,
@@ -52,14 +102,19 @@ class DataGenerator(LoggerMixin):
             email_domains: Custom list of email domains to use.
             seed: Optional seed for reproducible generation.
         """
-        self.faker = Faker(locale)
+        self.faker = _get_faker(locale)
+        # en_US names are sampled directly from Faker's tables, skipping provider dispatch
+        self._name_tables = _en_us_name_tables() if locale == "en_US" else None
         self.email_domains = email_domains or self.DEFAULT_EMAIL_DOMAINS
 
+        # Own generator so seeding never touches the global random state
+        self._rnd = random.Random(seed)
         if seed is not None:
+            from faker import Faker
+
             Faker.seed(seed)
-            random.seed(seed)
 
-        self.log.debug(f"DataGenerator initialized with locale={locale}")
+        self.log.debug("DataGenerator initialized with locale={}", locale)
 
     def generate_profile(self) -> UserProfile:
         """
@@ -68,8 +123,8 @@ class DataGenerator(LoggerMixin):
         Returns:
             UserProfile with randomly generated data.
         """
-        first_name = self.faker.first_name()
-        last_name = self.faker.last_name()
+        first_name = self.generate_first_name()
+        last_name = self.generate_last_name()
         email = self._generate_email(first_name, last_name)
         password = self._generate_password()
         birth_date = self._generate_birth_date()
@@ -82,7 +137,7 @@ class DataGenerator(LoggerMixin):
             birth_date=birth_date,
         )
 
-        self.log.debug(f"Generated profile: {profile.full_name} <{profile.email}>")
+        self.log.debug("Generated profile: {} <{}>", profile.full_name, profile.email)
         return profile
 
     def _generate_email(self, first_name: str, last_name: str) -> str:
@@ -96,20 +151,29 @@ class DataGenerator(LoggerMixin):
         Returns:
             Generated email address.
         """
-        domain = random.choice(self.email_domains)
-
-        # Different email patterns
-        patterns = [
-            f"{first_name.lower()}.{last_name.lower()}",
-            f"{first_name.lower()}{last_name.lower()}",
-            f"{first_name.lower()}.{last_name.lower()}{random.randint(1, 99)}",
-            f"{first_name.lower()}{random.randint(100, 999)}",
-            f"{first_name[0].lower()}{last_name.lower()}{random.randint(1, 99)}",
-        ]
-
-        local_part = random.choice(patterns)
+        domain = self._rnd.choice(self.email_domains)
+
+        first = first_name.lower()
+        last = last_name.lower()
+
+        # Different email patterns; only the chosen one is built
+        pattern = self._rnd.randrange(5)
+        if pattern == 0:
+            local_part = f"{first}.{last}"
+        elif pattern == 1:
+            local_part = f"{first}{last}"
+        elif pattern == 2:
+            local_part = f"{first}.{last}{self._rnd.randint(1, 99)}"
+        elif pattern == 3:
+            local_part = f"{first}{self._rnd.randint(100, 999)}"
+        else:
+            local_part = f"{first[0]}{last}{self._rnd.randint(1, 99)}"
+
         # Remove any non-alphanumeric characters except dots
-        local_part = "".join(c for c in local_part if c.isalnum() or c == ".")
+        if local_part.isascii():
+            local_part = local_part.encode("ascii").translate(None, _EMAIL_LOCAL_STRIP).decode("ascii")
+        else:
+            local_part = "".join(c for c in local_part if c.isalnum() or c == ".")
 
         return f"{local_part}@{domain}"
 
@@ -123,23 +187,18 @@ class DataGenerator(LoggerMixin):
         Returns:
             Generated password meeting common requirements.
         """
-        # Ensure password meets common requirements
-        lowercase = random.choices(string.ascii_lowercase, k=length // 3)
-        uppercase = random.choices(string.ascii_uppercase, k=length // 4)
-        digits = random.choices(string.digits, k=length // 4)
-        special = random.choices("!@#$%&*", k=2)
-
-        # Combine and shuffle
-        all_chars = lowercase + uppercase + digits + special
-        random.shuffle(all_chars)
+        chars = self._rnd.choices(self._PASSWORD_ALPHABET, k=length)
 
-        password = "".join(all_chars)
-
-        # Ensure minimum length
-        while len(password) < length:
-            password += random.choice(string.ascii_letters + string.digits)
+        # Ensure password meets common requirements
+        chars[:4] = (
+            self._rnd.choice(string.ascii_lowercase),
+            self._rnd.choice(string.ascii_uppercase),
+            self._rnd.choice(string.digits),
+            self._rnd.choice(self._PASSWORD_SPECIALS),
+        )
+        self._rnd.shuffle(chars)
 
-        return password
+        return "".join(chars)
 
     def _generate_birth_date(
         self,
@@ -156,29 +215,32 @@ class DataGenerator(LoggerMixin):
         Returns:
             Generated birth date.
         """
-        today = datetime.now()
-        min_date = today - timedelta(days=max_age * 365)
-        max_date = today - timedelta(days=min_age * 365)
-
-        # Random date between min and max
-        days_range = (max_date - min_date).days
-        random_days = random.randint(0, days_range)
+        today = date.today().toordinal()
 
-        return min_date + timedelta(days=random_days)
+        # Random day between min and max, as proleptic Gregorian ordinals
+        return datetime.fromordinal(
+            self._rnd.randint(today - max_age * 365, today - min_age * 365)
+        )
 
     def generate_first_name(self) -> str:
         """Generate a random first name."""
-        return self.faker.first_name()
+        if self._name_tables is None:
+            return self.faker.first_name()
+        names, cum_weights = self._name_tables[0]
+        return self._rnd.choices(names, cum_weights=cum_weights)[0]
 
     def generate_last_name(self) -> str:
         """Generate a random last name."""
-        return self.faker.last_name()
+        if self._name_tables is None:
+            return self.faker.last_name()
+        names, cum_weights = self._name_tables[1]
+        return self._rnd.choices(names, cum_weights=cum_weights)[0]
 
     def generate_email(self) -> str:
         """Generate a random email address."""
         return self._generate_email(
-            self.faker.first_name(),
-            self.faker.last_name(),
+            self.generate_first_name(),
+            self.generate_last_name(),
         )
 
     def generate_password(self) -> str:
@@ -198,7 +260,27 @@ class DataGenerator(LoggerMixin):
         if first_name:
             base = first_name.lower()
         else:
-            base = self.faker.first_name().lower()
+            base = self.generate_first_name().lower()
 
-        suffix = random.randint(100, 9999)
+        suffix = self._rnd.randint(100, 9999)
         return f"{base}{suffix}"
+
+
+# Shared instances per locale for convenience
+_data_generators: dict[str, DataGenerator] = {}
+
+
+def get_data_generator(locale: str = "en_US") -> DataGenerator:
+    """
+    Get or create the shared data generator for a locale.
+
+    Args:
+        locale: Faker locale for generating localized data.
+
+    Returns:
+        DataGenerator for the locale.
+    """
+    generator = _data_generators.get(locale)
+    if generator is None:
+        generator = _data_generators[locale] = DataGenerator(locale)
+    return generator
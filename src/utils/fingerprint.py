@@ -20,7 +20,24 @@ if TYPE_CHECKING:
     from src.utils.country_profiles import CountryProfile
 
 
-@dataclass
+_CHROME_VERSION_RE = re.compile(r"Chrome/(\d+)")
+
+
+def _build_sec_ch_ua(user_agent: str) -> str:
+    """Build the sec-ch-ua header value for a Chrome user agent."""
+    match = _CHROME_VERSION_RE.search(user_agent)
+    if match:
+        version = match.group(1)
+        return f'"Google Chrome";v="{version}", "Chromium";v="{version}", "Not_A Brand";v="24"'
+    return '"Google Chrome";v="120", "Chromium";v="120", "Not_A Brand";v="24"'
+
+
+def _ua_table(user_agents: tuple, platform_header: str) -> tuple:
+    """Pair each user agent with its sec-ch-ua-platform and sec-ch-ua values."""
+    return tuple((ua, platform_header, _build_sec_ch_ua(ua)) for ua in user_agents)
+
+
+@dataclass(slots=True)
 class BrowserFingerprint:
     """Represents a randomized browser fingerprint."""
 
@@ -40,13 +57,18 @@ class BrowserFingerprint:
     country_code: Optional[str] = None
     country_name: Optional[str] = None
 
+    # Built on first access and reused; slots rule out cached_property
+    _viewport: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def viewport(self) -> dict:
         """Get viewport configuration for Playwright."""
-        return {
-            "width": self.viewport_width,
-            "height": self.viewport_height,
-        }
+        if self._viewport is None:
+            self._viewport = {
+                "width": self.viewport_width,
+                "height": self.viewport_height,
+            }
+        return self._viewport
 
     @property
     def context_options(self) -> dict:
@@ -73,8 +95,10 @@ class FingerprintGenerator:
     parameters like user agents, viewports, timezones, etc.
     """
 
+    log = get_logger("FingerprintGenerator")
+
     # Chrome user agents for Windows (most common)
-    CHROME_USER_AGENTS = [
+    CHROME_USER_AGENTS = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
@@ -87,25 +111,31 @@ class FingerprintGenerator:
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-    ]
+    )
 
     # Chrome user agents for macOS
-    CHROME_MAC_USER_AGENTS = [
+    CHROME_MAC_USER_AGENTS = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
-    ]
+    )
+
+    # (user_agent, sec-ch-ua-platform, sec-ch-ua) choices per platform
+    UA_TABLES = {
+        "windows": _ua_table(CHROME_USER_AGENTS, '"Windows"'),
+        "mac": _ua_table(CHROME_MAC_USER_AGENTS, '"macOS"'),
+    }
 
     # Fixed 5K viewport for maximum resolution
-    DESKTOP_VIEWPORTS = [
+    DESKTOP_VIEWPORTS = (
         (5120, 2880),  # 5K resolution - maximized display
-    ]
+    )
 
     # Common timezones (weighted towards US/EU for Airbnb)
-    TIMEZONES = [
+    TIMEZONES = (
         "America/New_York",
         "America/Chicago",
         "America/Denver",
@@ -121,10 +151,10 @@ class FingerprintGenerator:
         "Australia/Sydney",
         "Asia/Tokyo",
         "Asia/Singapore",
-    ]
+    )
 
     # Locales matching timezones
-    LOCALES = [
+    LOCALES = (
         "en-US",
         "en-GB",
         "en-CA",
@@ -135,10 +165,29 @@ class FingerprintGenerator:
         "it-IT",
         "nl-NL",
         "pt-BR",
-    ]
+    )
+
+    # Locale to use for each timezone
+    TIMEZONE_LOCALES = {
+        "America/New_York": "en-US",
+        "America/Chicago": "en-US",
+        "America/Denver": "en-US",
+        "America/Los_Angeles": "en-US",
+        "America/Phoenix": "en-US",
+        "America/Toronto": "en-CA",
+        "Europe/London": "en-GB",
+        "Europe/Paris": "fr-FR",
+        "Europe/Berlin": "de-DE",
+        "Europe/Madrid": "es-ES",
+        "Europe/Rome": "it-IT",
+        "Europe/Amsterdam": "nl-NL",
+        "Australia/Sydney": "en-AU",
+        "Asia/Tokyo": "en-US",  # Many English speakers
+        "Asia/Singapore": "en-US",
+    }
 
     # Accept-Language headers
-    ACCEPT_LANGUAGES = [
+    ACCEPT_LANGUAGES = (
         "en-US,en;q=0.9",
         "en-GB,en;q=0.9,en-US;q=0.8",
         "en-US,en;q=0.9,es;q=0.8",
@@ -147,7 +196,16 @@ class FingerprintGenerator:
         "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
         "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
         "es-ES,es;q=0.9,en-US;q=0.8,en;q=0.7",
-    ]
+    )
+
+    # Device scale factors (most common is 1.0, repeated for weighting)
+    DEVICE_SCALE_FACTORS = (1.0, 1.0, 1.0, 1.25, 1.5)
+
+    # Color schemes (most use light)
+    COLOR_SCHEMES = ("light", "light", "light", "dark")
+
+    # Reduced-motion preferences
+    REDUCED_MOTIONS = ("no-preference", "no-preference", "reduce")
 
     def __init__(self, seed: Optional[int] = None):
         """
@@ -156,9 +214,8 @@ class FingerprintGenerator:
         Args:
             seed: Optional random seed for reproducibility.
         """
-        self.log = get_logger("FingerprintGenerator")
-        if seed is not None:
-            random.seed(seed)
+        # Own generator so seeding never touches the global random state
+        self._rnd = random.Random(seed)
 
     def generate(self, platform: str = "windows") -> BrowserFingerprint:
         """
@@ -172,13 +229,12 @@ class FingerprintGenerator:
         """
         # Select platform
         if platform == "random":
-            platform = random.choice(["windows", "mac"])
+            platform = self._rnd.choice(("windows", "mac"))
 
-        # Select user agent based on platform
-        if platform == "mac":
-            user_agent = random.choice(self.CHROME_MAC_USER_AGENTS)
-        else:
-            user_agent = random.choice(self.CHROME_USER_AGENTS)
+        # Select user agent and its client hints based on platform
+        user_agent, platform_header, sec_ch_ua = self._rnd.choice(
+            self.UA_TABLES.get(platform) or self.UA_TABLES["windows"]
+        )
 
         # Use fixed Full HD viewport (1920x1080)
         viewport = self.DESKTOP_VIEWPORTS[0]
@@ -186,14 +242,14 @@ class FingerprintGenerator:
         height = viewport[1]
 
         # Select timezone and matching locale
-        timezone = random.choice(self.TIMEZONES)
-        locale = self._get_locale_for_timezone(timezone)
+        timezone = self._rnd.choice(self.TIMEZONES)
+        locale = self.TIMEZONE_LOCALES.get(timezone, "en-US")
 
         # Select accept-language header
-        accept_language = random.choice(self.ACCEPT_LANGUAGES)
+        accept_language = self._rnd.choice(self.ACCEPT_LANGUAGES)
 
         # Device scale factor (most common is 1.0 or 1.25)
-        device_scale_factor = random.choice([1.0, 1.0, 1.0, 1.25, 1.5])
+        device_scale_factor = self._rnd.choice(self.DEVICE_SCALE_FACTORS)
 
         fingerprint = BrowserFingerprint(
             user_agent=user_agent,
@@ -202,51 +258,21 @@ class FingerprintGenerator:
             device_scale_factor=device_scale_factor,
             timezone_id=timezone,
             locale=locale,
-            color_scheme=random.choice(["light", "light", "light", "dark"]),  # Most use light
-            reduced_motion=random.choice(["no-preference", "no-preference", "reduce"]),
+            color_scheme=self._rnd.choice(self.COLOR_SCHEMES),
+            reduced_motion=self._rnd.choice(self.REDUCED_MOTIONS),
             has_touch=False,  # Desktop doesn't have touch
             is_mobile=False,
             extra_http_headers={
                 "Accept-Language": accept_language,
-                "sec-ch-ua": self._generate_sec_ch_ua(user_agent),
+                "sec-ch-ua": sec_ch_ua,
                 "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"' if platform == "windows" else '"macOS"',
+                "sec-ch-ua-platform": platform_header,
             },
         )
 
-        self.log.debug(f"Generated fingerprint: {viewport[0]}x{viewport[1]}, {timezone}")
+        self.log.debug("Generated fingerprint: {}x{}, {}", width, height, timezone)
         return fingerprint
 
-    def _get_locale_for_timezone(self, timezone: str) -> str:
-        """Get an appropriate locale for a timezone."""
-        timezone_locale_map = {
-            "America/New_York": "en-US",
-            "America/Chicago": "en-US",
-            "America/Denver": "en-US",
-            "America/Los_Angeles": "en-US",
-            "America/Phoenix": "en-US",
-            "America/Toronto": "en-CA",
-            "Europe/London": "en-GB",
-            "Europe/Paris": "fr-FR",
-            "Europe/Berlin": "de-DE",
-            "Europe/Madrid": "es-ES",
-            "Europe/Rome": "it-IT",
-            "Europe/Amsterdam": "nl-NL",
-            "Australia/Sydney": "en-AU",
-            "Asia/Tokyo": "en-US",  # Many English speakers
-            "Asia/Singapore": "en-US",
-        }
-        return timezone_locale_map.get(timezone, "en-US")
-
-    def _generate_sec_ch_ua(self, user_agent: str) -> str:
-        """Generate sec-ch-ua header based on user agent."""
-        # Extract Chrome version from user agent
-        match = re.search(r"Chrome/(\d+)", user_agent)
-        if match:
-            version = match.group(1)
-            return f'"Google Chrome";v="{version}", "Chromium";v="{version}", "Not_A Brand";v="24"'
-        return '"Google Chrome";v="120", "Chromium";v="120", "Not_A Brand";v="24"'
-
     def generate_for_phone(self, phone_number: str, platform: str = "windows") -> BrowserFingerprint:
         """
         Generate a fingerprint matching a phone number's country.
@@ -278,17 +304,16 @@ class FingerprintGenerator:
         Returns:
             BrowserFingerprint matching the country.
         """
-        self.log.info(f"Generating fingerprint for {profile.country_name} (+{profile.country_code})")
+        self.log.info("Generating fingerprint for {} (+{})", profile.country_name, profile.country_code)
 
         # Select platform
         if platform == "random":
-            platform = random.choice(["windows", "mac"])
+            platform = self._rnd.choice(("windows", "mac"))
 
-        # Select user agent based on platform
-        if platform == "mac":
-            user_agent = random.choice(self.CHROME_MAC_USER_AGENTS)
-        else:
-            user_agent = random.choice(self.CHROME_USER_AGENTS)
+        # Select user agent and its client hints based on platform
+        user_agent, platform_header, sec_ch_ua = self._rnd.choice(
+            self.UA_TABLES.get(platform) or self.UA_TABLES["windows"]
+        )
 
         # Use fixed Full HD viewport (1920x1080)
         viewport = self.DESKTOP_VIEWPORTS[0]
@@ -296,12 +321,12 @@ class FingerprintGenerator:
         height = viewport[1]
 
         # Get country-specific values from profile
-        timezone = profile.get_random_timezone()
-        locale = profile.get_random_locale()
-        accept_language = profile.get_random_accept_language()
+        timezone = self._rnd.choice(profile.timezones)
+        locale = self._rnd.choice(profile.locales)
+        accept_language = self._rnd.choice(profile.accept_languages)
 
         # Device scale factor
-        device_scale_factor = random.choice([1.0, 1.0, 1.0, 1.25, 1.5])
+        device_scale_factor = self._rnd.choice(self.DEVICE_SCALE_FACTORS)
 
         fingerprint = BrowserFingerprint(
             user_agent=user_agent,
@@ -310,21 +335,21 @@ class FingerprintGenerator:
             device_scale_factor=device_scale_factor,
             timezone_id=timezone,
             locale=locale,
-            color_scheme=random.choice(["light", "light", "light", "dark"]),
-            reduced_motion=random.choice(["no-preference", "no-preference", "reduce"]),
+            color_scheme=self._rnd.choice(self.COLOR_SCHEMES),
+            reduced_motion=self._rnd.choice(self.REDUCED_MOTIONS),
             has_touch=False,
             is_mobile=False,
             extra_http_headers={
                 "Accept-Language": accept_language,
-                "sec-ch-ua": self._generate_sec_ch_ua(user_agent),
+                "sec-ch-ua": sec_ch_ua,
                 "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"' if platform == "windows" else '"macOS"',
+                "sec-ch-ua-platform": platform_header,
             },
             country_code=profile.country_code,
             country_name=profile.country_name,
         )
 
-        self.log.info(f"  Fingerprint: {width}x{height}, {timezone}, {locale}")
+        self.log.info("  Fingerprint: {}x{}, {}, {}", width, height, timezone, locale)
         return fingerprint
 
 
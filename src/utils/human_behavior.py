@@ -9,17 +9,18 @@ Includes realistic typing, mouse movements, scrolling, and delays.
 import asyncio
 import random
 import math
-from typing import Optional, Tuple, List
+from typing import Dict, Literal, Optional, Tuple, List
 from dataclasses import dataclass
 
 from playwright.async_api import Page, Locator, ElementHandle
 
+from src.config import get_settings
 from src.utils.logger import get_logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HumanBehaviorConfig:
-    """Configuration for human behavior simulation."""
+    """Configuration for human behavior simulation (immutable once built)."""
 
     # Typing configuration
     typing_speed_min: int = 50   # ms between keystrokes (fast typer)
@@ -41,6 +42,89 @@ class HumanBehaviorConfig:
     scroll_speed_min: int = 100  # pixels per scroll step
     scroll_speed_max: int = 300  # pixels per scroll step
 
+    # Form filling: "full" simulation, "fast" typing, or "off" (instant fill)
+    realism: Literal["full", "fast", "off"] = "full"
+
+
+# Simplified keyboard layout for common typos: key -> neighboring keys
+_KEYBOARD_NEIGHBORS: Dict[str, str] = {
+    "a": "sqz",
+    "b": "vngh",
+    "c": "xvdf",
+    "d": "sfercx",
+    "e": "wrds",
+    "f": "dgrtvc",
+    "g": "fhtybv",
+    "h": "gjyunb",
+    "i": "uokj",
+    "j": "hkuimn",
+    "k": "jliom",
+    "l": "kop",
+    "m": "njk",
+    "n": "bmhj",
+    "o": "ipkl",
+    "p": "ol",
+    "q": "wa",
+    "r": "etdf",
+    "s": "adwexz",
+    "t": "ryfg",
+    "u": "yihj",
+    "v": "cbfg",
+    "w": "qeas",
+    "x": "zcsd",
+    "y": "tugh",
+    "z": "axs",
+    "0": "9-",
+    "1": "2q",
+    "2": "13qw",
+    "3": "24we",
+    "4": "35er",
+    "5": "46rt",
+    "6": "57ty",
+    "7": "68yu",
+    "8": "79ui",
+    "9": "80io",
+}
+
+# Curve waypoints per mouse movement
+_MOUSE_WAYPOINTS = 4
+
+# Private generator for all behavior draws; timing noise needs no
+# cryptographic entropy, so SystemRandom is not used here
+_rand = random.Random()
+
+# Characters per typing burst (inclusive range)
+_BURST_SIZES = range(4, 11)
+
+
+def _bezier_weights(steps: int) -> Tuple[Tuple[float, float, float, float, float], ...]:
+    """
+    Get cubic Bezier weights for a path of ``steps`` equal intervals.
+
+    Args:
+        steps: Number of intervals between start and target.
+
+    Returns:
+        One (b0, b1, b2, b3, speed_factor) row per point from t=0 to t=1.
+        The speed factor is faster in the middle and slower at the ends.
+    """
+    rows = []
+    for i in range(steps + 1):
+        t = i / steps
+        u = 1 - t
+        rows.append((
+            u * u * u,
+            3 * u * u * t,
+            3 * u * t * t,
+            t * t * t,
+            1.0 - 0.5 * math.sin(math.pi * t),
+        ))
+    return tuple(rows)
+
+
+# Weights for every mouse movement, computed once at import
+_MOUSE_BEZIER_WEIGHTS = _bezier_weights(_MOUSE_WAYPOINTS)
+
 
 class HumanBehavior:
     """
@@ -60,12 +144,23 @@ class HumanBehavior:
 
         Args:
             page: Playwright page instance.
-            config: Optional behavior configuration.
+            config: Optional behavior configuration. Defaults take their
+                realism level from the HUMAN_REALISM setting.
         """
         self.page = page
-        self.config = config or HumanBehaviorConfig()
+        self.config = config or HumanBehaviorConfig(
+            realism=get_settings().human_behavior.realism
+        )
         self.log = get_logger("HumanBehavior")
         self._last_mouse_position: Tuple[int, int] = (0, 0)
+        self._viewport: Optional[dict] = None
+
+        # Snapshot config ranges read on every action
+        config = self.config
+        self._typing_speed = (config.typing_speed_min, config.typing_speed_max)
+        self._action_delay = (config.action_delay_min, config.action_delay_max)
+        self._think_delay = (config.think_delay_min, config.think_delay_max)
+        self._scroll_speed = (config.scroll_speed_min, config.scroll_speed_max)
 
     async def type_like_human(
         self,
@@ -81,7 +176,7 @@ class HumanBehavior:
             text: Text to type.
             clear_first: Whether to clear the field first.
         """
-        self.log.debug(f"Human typing: {text[:20]}...")
+        self.log.debug("Human typing: {}...", text[:20])
 
         # Focus and clear if needed
         await locator.click()
@@ -91,42 +186,75 @@ class HumanBehavior:
             await locator.fill("")
             await self.random_delay(50, 150)
 
-        # Type character by character with human-like timing
-        i = 0
-        while i < len(text):
-            char = text[i]
-
-            # Simulate occasional typo and correction
-            if (
-                self.config.typo_probability > 0
-                and random.random() < self.config.typo_probability
-                and i < len(text) - 1
-            ):
-                # Make a typo
-                wrong_char = self._get_nearby_key(char)
-                if wrong_char != char:
-                    await locator.press(wrong_char)
-                    await self.random_delay(50, 150)
-                    # Realize mistake and correct
-                    await self.random_delay(200, 500)  # "Notice" the mistake
-                    await locator.press("Backspace")
-                    await self.random_delay(50, 100)
-
-            # Type the correct character
-            await locator.press(char)
-
-            # Variable delay between keystrokes
-            delay = random.randint(
-                self.config.typing_speed_min,
-                self.config.typing_speed_max,
-            )
+        keyboard = self.page.keyboard
+        length = len(text)
+
+        # Plan typos up front (never on the last character)
+        typos = self._plan_typos(length - 1)
+
+        # Type in short bursts; Playwright paces keystrokes inside a burst
+        bursts = iter(_rand.choices(_BURST_SIZES, k=-(-length // _BURST_SIZES[0])))
+        pos = 0
+        while pos < length:
+            end = min(length, pos + next(bursts))
+            start = pos
+
+            for i in range(pos, end):
+                if i not in typos:
+                    continue
+                wrong_char = self._get_nearby_key(text[i])
+                if wrong_char == text[i]:
+                    continue
+
+                # Make a typo, "notice" it, and correct it
+                if i > start:
+                    await keyboard.type(text[start:i], delay=self._keystroke_delay())
+                await keyboard.press(wrong_char)
+                await self.random_delay(50, 150)
+                await self.random_delay(200, 500)
+                await keyboard.press("Backspace")
+                await self.random_delay(50, 100)
+                start = i
+
+            await keyboard.type(text[start:end], delay=self._keystroke_delay())
+
+            # Occasional pause between bursts (like thinking)
+            if _rand.random() < 1 - (1 - self.config.pause_probability) ** (end - pos):
+                await self.random_delay(200, 800)
+
+            pos = end
+
+    def _plan_typos(self, count: int) -> set:
+        """
+        Pick which of the first ``count`` characters get a typo.
+
+        Gaps between typos are drawn from the geometric distribution, so
+        this costs one draw per typo rather than one per character.
 
-            # Occasional pause (like thinking)
-            if random.random() < self.config.pause_probability:
-                delay += random.randint(200, 800)
+        Args:
+            count: Number of eligible character positions.
 
-            await asyncio.sleep(delay / 1000)
-            i += 1
+        Returns:
+            Set of character indices to mistype.
+        """
+        p = self.config.typo_probability
+        if p <= 0 or count <= 0:
+            return set()
+        if p >= 1:
+            return set(range(count))
+
+        log_q = math.log(1 - p)
+        rand = _rand.random
+        typos = set()
+        i = int(math.log(1 - rand()) / log_q)
+        while i < count:
+            typos.add(i)
+            i += 1 + int(math.log(1 - rand()) / log_q)
+        return typos
+
+    def _keystroke_delay(self) -> int:
+        """Get a random delay in ms between keystrokes."""
+        return _rand.randint(*self._typing_speed)
 
     async def click_like_human(
         self,
@@ -150,8 +278,8 @@ class HumanBehavior:
         # Calculate click position with slight randomization
         # Humans don't click exactly in the center
         jitter = self.config.mouse_jitter
-        target_x = box["x"] + box["width"] / 2 + random.randint(-jitter, jitter)
-        target_y = box["y"] + box["height"] / 2 + random.randint(-jitter, jitter)
+        target_x = box["x"] + box["width"] / 2 + _rand.randint(-jitter, jitter)
+        target_y = box["y"] + box["height"] / 2 + _rand.randint(-jitter, jitter)
 
         # Ensure click is within bounds
         target_x = max(box["x"] + 5, min(target_x, box["x"] + box["width"] - 5))
@@ -168,12 +296,13 @@ class HumanBehavior:
         await self.page.mouse.click(target_x, target_y)
         self._last_mouse_position = (int(target_x), int(target_y))
 
-        self.log.debug(f"Human click at ({target_x:.0f}, {target_y:.0f})")
+        self.log.debug("Human click at ({:.0f}, {:.0f})", target_x, target_y)
 
     async def scroll_like_human(
         self,
         direction: str = "down",
         amount: int = 300,
+        pace: bool = True,
     ) -> None:
         """
         Scroll the page with human-like behavior.
@@ -181,16 +310,20 @@ class HumanBehavior:
         Args:
             direction: 'up' or 'down'.
             amount: Total pixels to scroll.
+            pace: Whether to scroll in paced steps. If False, scroll the
+                whole amount in a single wheel event.
         """
         scrolled = 0
         sign = -1 if direction == "down" else 1
 
+        if not pace:
+            await self.page.mouse.wheel(0, sign * amount)
+            self.log.debug("Scrolled {} {}px", direction, amount)
+            return
+
         while scrolled < amount:
             # Variable scroll amount
-            step = random.randint(
-                self.config.scroll_speed_min,
-                self.config.scroll_speed_max,
-            )
+            step = _rand.randint(*self._scroll_speed)
             step = min(step, amount - scrolled)
 
             await self.page.mouse.wheel(0, sign * step)
@@ -199,7 +332,7 @@ class HumanBehavior:
             # Variable delay between scroll steps
             await self.random_delay(30, 100)
 
-        self.log.debug(f"Scrolled {direction} {amount}px")
+        self.log.debug("Scrolled {} {}px", direction, amount)
 
     async def random_delay(
         self,
@@ -213,32 +346,35 @@ class HumanBehavior:
             min_ms: Minimum delay in milliseconds.
             max_ms: Maximum delay in milliseconds.
         """
-        min_ms = min_ms or self.config.action_delay_min
-        max_ms = max_ms or self.config.action_delay_max
-        delay = random.randint(min_ms, max_ms)
+        min_ms = min_ms or self._action_delay[0]
+        max_ms = max_ms or self._action_delay[1]
+        delay = _rand.randint(min_ms, max_ms)
         await asyncio.sleep(delay / 1000)
 
     async def think_delay(self) -> None:
         """Simulate a 'thinking' pause, longer than action delay."""
-        delay = random.randint(
-            self.config.think_delay_min,
-            self.config.think_delay_max,
-        )
-        self.log.debug(f"Thinking pause: {delay}ms")
+        delay = _rand.randint(*self._think_delay)
+        self.log.debug("Thinking pause: {}ms", delay)
         await asyncio.sleep(delay / 1000)
 
     async def random_mouse_movement(self) -> None:
         """Make a random mouse movement to simulate human activity."""
-        viewport = self.page.viewport_size
+        viewport = self._viewport_size()
         if not viewport:
             return
 
         # Random position within viewport
-        x = random.randint(100, viewport["width"] - 100)
-        y = random.randint(100, viewport["height"] - 100)
+        x = _rand.randint(100, viewport["width"] - 100)
+        y = _rand.randint(100, viewport["height"] - 100)
 
         await self._move_mouse_naturally(x, y)
 
+    def _viewport_size(self) -> Optional[dict]:
+        """Get the page viewport size, cached after the first lookup."""
+        if self._viewport is None:
+            self._viewport = self.page.viewport_size
+        return self._viewport
+
     async def _move_mouse_naturally(
         self,
         target_x: int,
@@ -255,96 +391,55 @@ class HumanBehavior:
 
         # If starting from (0,0), set a reasonable start position
         if start_x == 0 and start_y == 0:
-            viewport = self.page.viewport_size
+            viewport = self._viewport_size()
             if viewport:
                 start_x = viewport["width"] // 2
                 start_y = viewport["height"] // 2
 
         # Calculate distance
-        distance = math.sqrt((target_x - start_x) ** 2 + (target_y - start_y) ** 2)
+        distance = math.hypot(target_x - start_x, target_y - start_y)
 
         # Number of steps based on distance
         steps = max(5, int(distance / 50))
 
         # Generate control points for Bezier curve
         # Add some randomness to make it look natural
-        ctrl1_x = start_x + (target_x - start_x) * 0.3 + random.randint(-50, 50)
-        ctrl1_y = start_y + (target_y - start_y) * 0.3 + random.randint(-50, 50)
-        ctrl2_x = start_x + (target_x - start_x) * 0.7 + random.randint(-50, 50)
-        ctrl2_y = start_y + (target_y - start_y) * 0.7 + random.randint(-50, 50)
-
-        # Move along the curve
-        for i in range(steps + 1):
-            t = i / steps
-
-            # Cubic Bezier formula
-            x = (
-                (1 - t) ** 3 * start_x
-                + 3 * (1 - t) ** 2 * t * ctrl1_x
-                + 3 * (1 - t) * t ** 2 * ctrl2_x
-                + t ** 3 * target_x
-            )
-            y = (
-                (1 - t) ** 3 * start_y
-                + 3 * (1 - t) ** 2 * t * ctrl1_y
-                + 3 * (1 - t) * t ** 2 * ctrl2_y
-                + t ** 3 * target_y
+        randint = _rand.randint
+        ctrl1_x = start_x + (target_x - start_x) * 0.3 + randint(-50, 50)
+        ctrl1_y = start_y + (target_y - start_y) * 0.3 + randint(-50, 50)
+        ctrl2_x = start_x + (target_x - start_x) * 0.7 + randint(-50, 50)
+        ctrl2_y = start_y + (target_y - start_y) * 0.7 + randint(-50, 50)
+
+        # Sample a few waypoints on the curve; Playwright interpolates the
+        # points between consecutive waypoints inside a single move() call
+        arc_steps = -(-steps // _MOUSE_WAYPOINTS)
+        mouse_speed = self.config.mouse_speed
+        path = [
+            (
+                b0 * start_x + b1 * ctrl1_x + b2 * ctrl2_x + b3 * target_x,
+                b0 * start_y + b1 * ctrl1_y + b2 * ctrl2_y + b3 * target_y,
+                int(10 * arc_steps * speed_factor / mouse_speed) / 1000,
             )
+            for b0, b1, b2, b3, speed_factor in _MOUSE_BEZIER_WEIGHTS
+        ]
 
-            await self.page.mouse.move(x, y)
+        mouse = self.page.mouse
+        if (start_x, start_y) != self._last_mouse_position:
+            await mouse.move(start_x, start_y)
 
-            # Variable speed (faster in middle, slower at ends)
-            speed_factor = 1.0 - 0.5 * math.sin(math.pi * t)
-            delay = int(10 * speed_factor / self.config.mouse_speed)
-            await asyncio.sleep(delay / 1000)
+        # Move along the curve
+        for x, y, delay in path[1:]:
+            await mouse.move(x, y, steps=arc_steps)
+            # Fast mouse speeds round the pause to 0ms: just yield
+            await asyncio.sleep(delay if delay > 0 else 0)
 
         self._last_mouse_position = (target_x, target_y)
 
     def _get_nearby_key(self, char: str) -> str:
         """Get a nearby key on the keyboard for typo simulation."""
-        # Simplified keyboard layout for common typos
-        keyboard_neighbors = {
-            'a': ['s', 'q', 'z'],
-            'b': ['v', 'n', 'g', 'h'],
-            'c': ['x', 'v', 'd', 'f'],
-            'd': ['s', 'f', 'e', 'r', 'c', 'x'],
-            'e': ['w', 'r', 'd', 's'],
-            'f': ['d', 'g', 'r', 't', 'v', 'c'],
-            'g': ['f', 'h', 't', 'y', 'b', 'v'],
-            'h': ['g', 'j', 'y', 'u', 'n', 'b'],
-            'i': ['u', 'o', 'k', 'j'],
-            'j': ['h', 'k', 'u', 'i', 'm', 'n'],
-            'k': ['j', 'l', 'i', 'o', 'm'],
-            'l': ['k', 'o', 'p'],
-            'm': ['n', 'j', 'k'],
-            'n': ['b', 'm', 'h', 'j'],
-            'o': ['i', 'p', 'k', 'l'],
-            'p': ['o', 'l'],
-            'q': ['w', 'a'],
-            'r': ['e', 't', 'd', 'f'],
-            's': ['a', 'd', 'w', 'e', 'x', 'z'],
-            't': ['r', 'y', 'f', 'g'],
-            'u': ['y', 'i', 'h', 'j'],
-            'v': ['c', 'b', 'f', 'g'],
-            'w': ['q', 'e', 'a', 's'],
-            'x': ['z', 'c', 's', 'd'],
-            'y': ['t', 'u', 'g', 'h'],
-            'z': ['a', 'x', 's'],
-            '0': ['9', '-'],
-            '1': ['2', 'q'],
-            '2': ['1', '3', 'q', 'w'],
-            '3': ['2', '4', 'w', 'e'],
-            '4': ['3', '5', 'e', 'r'],
-            '5': ['4', '6', 'r', 't'],
-            '6': ['5', '7', 't', 'y'],
-            '7': ['6', '8', 'y', 'u'],
-            '8': ['7', '9', 'u', 'i'],
-            '9': ['8', '0', 'i', 'o'],
-        }
-
-        char_lower = char.lower()
-        if char_lower in keyboard_neighbors:
-            nearby = random.choice(keyboard_neighbors[char_lower])
+        neighbors = _KEYBOARD_NEIGHBORS.get(char.lower())
+        if neighbors:
+            nearby = _rand.choice(neighbors)
             return nearby.upper() if char.isupper() else nearby
 
         return char  # Return original if no neighbors defined
@@ -357,19 +452,19 @@ class HumanBehavior:
             duration_ms: Approximate time to "read" in milliseconds.
         """
         # Vary the actual reading time
-        actual_duration = duration_ms + random.randint(-500, 500)
+        actual_duration = duration_ms + _rand.randint(-500, 500)
         actual_duration = max(500, actual_duration)
 
         # Occasionally move mouse while "reading"
-        segments = random.randint(1, 3)
+        segments = _rand.randint(1, 3)
         segment_duration = actual_duration / segments
 
         for _ in range(segments):
             await asyncio.sleep(segment_duration / 1000)
-            if random.random() < 0.3:  # 30% chance of mouse movement
+            if _rand.random() < 0.3:  # 30% chance of mouse movement
                 await self.random_mouse_movement()
 
-        self.log.debug(f"Simulated reading for {actual_duration}ms")
+        self.log.debug("Simulated reading for {}ms", actual_duration)
 
     async def fill_form_field(
         self,
@@ -380,11 +475,24 @@ class HumanBehavior:
         """
         Fill a form field with human-like behavior.
 
+        With realism "off" the value is filled instantly; with "fast" it
+        is typed at a fixed quick pace without pauses or typos.
+
         Args:
             locator: Form field locator.
             value: Value to fill.
             pre_delay: Whether to add a delay before filling.
         """
+        realism = self.config.realism
+        if realism == "off":
+            await locator.fill(value)
+            return
+        if realism == "fast":
+            await locator.click()
+            await locator.fill("")
+            await self.page.keyboard.type(value, delay=20)
+            return
+
         if pre_delay:
             await self.think_delay()
 
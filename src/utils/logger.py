@@ -8,6 +8,7 @@ console output formatting.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,9 @@ from loguru import logger
 
 from src.config import get_settings
 
+# Set once the sinks are installed; repeat setup_logger() calls are no-ops
+_configured = False
+
 
 def setup_logger() -> None:
     """
@@ -24,8 +28,16 @@ def setup_logger() -> None:
     - Console output with colored formatting
     - File output with rotation and retention
     - Structured logging format
+
+    Only the first call installs sinks, so the enqueued file writers
+    are not torn down and restarted by later calls.
     """
-    settings = get_settings()
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    log_settings = get_settings().log
 
     # Remove default handler
     logger.remove()
@@ -39,12 +51,12 @@ def setup_logger() -> None:
             "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
             "<level>{message}</level>"
         ),
-        level=settings.log.level,
+        level=log_settings.level,
         colorize=True,
     )
 
     # Ensure log directory exists
-    log_dir = Path(settings.log.dir)
+    log_dir = Path(log_settings.dir)
     log_dir.mkdir(parents=True, exist_ok=True)
 
     # File handler with rotation
@@ -56,9 +68,9 @@ def setup_logger() -> None:
             "{name}:{function}:{line} | "
             "{message}"
         ),
-        level=settings.log.level,
-        rotation=settings.log.rotation,
-        retention=settings.log.retention,
+        level=log_settings.level,
+        rotation=log_settings.rotation,
+        retention=log_settings.retention,
         compression="zip",
         enqueue=True,  # Thread-safe
     )
@@ -73,8 +85,8 @@ def setup_logger() -> None:
             "{message}\n{exception}"
         ),
         level="ERROR",
-        rotation=settings.log.rotation,
-        retention=settings.log.retention,
+        rotation=log_settings.rotation,
+        retention=log_settings.retention,
         compression="zip",
         enqueue=True,
         backtrace=True,
@@ -84,10 +96,14 @@ def setup_logger() -> None:
     logger.info("Logger initialized successfully")
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str | None = None) -> Any:
     """
     Get a logger instance with optional context binding.
 
+    Bound loggers are cached per name, so every caller asking for the
+    same name shares one instance.
+
     Args:
         name: Optional name to bind to the logger context.
 
@@ -111,5 +127,11 @@ class LoggerMixin:
 
     @property
     def log(self) -> Any:
-        """Get a logger bound to the class name."""
-        return logger.bind(name=self.__class__.__name__)
+        """Get a logger bound to the class name, cached on the class."""
+        cls = type(self)
+        # Look in the class's own dict so subclasses get their own name
+        bound = cls.__dict__.get("_bound_log")
+        if bound is None:
+            bound = get_logger(cls.__name__)
+            cls._bound_log = bound
+        return bound
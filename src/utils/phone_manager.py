@@ -9,12 +9,23 @@ Manages phone numbers for signup operations including:
 - Persisting usage state
 """
 
+import asyncio
+import atexit
+import os
+import re
+import sys
+from collections import deque
 from pathlib import Path
 
 import aiofiles
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None
+
 from src.types.enums import Platform
-from src.types.models import PhoneNumber
+from src.types.phone import PhoneNumber, digits_only
 from src.utils.logger import LoggerMixin
 
 # File paths relative to project root
@@ -23,6 +34,9 @@ DATA_DIR = PROJECT_ROOT / "data"
 SUCCESS_FILE = DATA_DIR / "success.txt"
 FAILED_FILE = DATA_DIR / "failed.txt"
 
+# Cheap shape check so junk lines never become PhoneNumber objects
+_has_digit = re.compile(r"\d").search
+
 
 class PhoneManager(LoggerMixin):
     """
@@ -47,10 +61,24 @@ class PhoneManager(LoggerMixin):
         """
         self.phone_list_path = Path(phone_list_path)
         self.platform = platform
-
-        self._all_phones: list[PhoneNumber] = []
+        self._platform_str = str(platform)
+
+        # Unique valid numbers from the list, in file order (ordered set)
+        self._numbers: dict[str, None] = {}
+        # Unprocessed numbers (digits only); PhoneNumber is built on demand
+        self._pending: deque[str] = deque()
+        # Listed numbers not yet processed; _pending may still hold some
+        # processed entries that get_next has not reached yet
+        self._available = 0
         self._success_numbers: set[str] = set()
         self._failed_numbers: set[str] = set()
+        # Union of the two sets above, for single-probe membership checks
+        self._processed: set[str] = set()
+        # Bytes of each processed file already folded into the sets
+        self._offsets: dict[Path, int] = {}
+        # Long-lived O_APPEND descriptors, opened on first mark
+        self._fds: dict[Path, int] = {}
+        self._close_at_exit = False
         self._loaded = False
 
     async def load(self) -> None:
@@ -60,77 +88,228 @@ class PhoneManager(LoggerMixin):
         # Ensure data directory exists
         DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+        # Load processed numbers first so the list parse can filter on them
+        self._offsets.clear()
+        self._success_numbers = set()
+        self._failed_numbers = set()
+        self._processed = set()
+        self.refresh()
+
         # Load all phone numbers from file
         await self._load_phone_list()
 
-        # Load processed numbers
-        self._success_numbers = self._load_numbers_from_file(SUCCESS_FILE)
-        self._failed_numbers = self._load_numbers_from_file(FAILED_FILE)
-
         self._loaded = True
 
-        processed = len(self._success_numbers) + len(self._failed_numbers)
-        available = len(self._all_phones) - processed
+        available = self.available_count
 
-        self.log.info(f"Phone stats:")
-        self.log.info(f"  Total: {len(self._all_phones)}")
-        self.log.info(f"  Success: {len(self._success_numbers)}")
-        self.log.info(f"  Failed: {len(self._failed_numbers)}")
-        self.log.info(f"  Available: {available}")
+        self.log.info("Phone stats:")
+        self.log.info("  Total: {}", len(self._numbers))
+        self.log.info("  Success: {}", len(self._success_numbers))
+        self.log.info("  Failed: {}", len(self._failed_numbers))
+        self.log.info("  Available: {}", available)
 
     async def _load_phone_list(self) -> None:
-        """Load phone numbers from the file."""
-        if not self.phone_list_path.exists():
-            self.log.error(f"Phone list not found: {self.phone_list_path}")
-            raise FileNotFoundError(f"Phone list not found: {self.phone_list_path}")
-
-        phones: list[PhoneNumber] = []
-
-        async with aiofiles.open(self.phone_list_path, "r") as f:
-            content = await f.read()
-            for line in content.strip().split("\n"):
-                number = line.strip()
-                if number:
-                    try:
-                        phone = PhoneNumber(number=number, platform=self.platform)
-                        phones.append(phone)
-                    except ValueError as e:
-                        self.log.warning(f"Invalid phone number '{number}': {e}")
-
-        self._all_phones = phones
-        self.log.debug(f"Loaded {len(phones)} phone numbers from file")
-
-    def _load_numbers_from_file(self, filepath: Path) -> set[str]:
-        """Load phone numbers from a text file (one per line)."""
-        numbers = set()
-
-        if not filepath.exists():
-            return numbers
+        """
+        Load phone numbers from the file.
 
+        Unprocessed numbers are queued for get_next; already-processed
+        numbers are only counted, and duplicates are dropped.
+        """
+        # One bulk read: aiofiles line iteration hops to a worker thread per line
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    number = line.strip()
-                    if number:
-                        numbers.add(number)
-            self.log.debug(f"Loaded {len(numbers)} numbers from {filepath.name}")
-        except Exception as e:
-            self.log.error(f"Error reading {filepath}: {e}")
+            async with aiofiles.open(self.phone_list_path, "r") as f:
+                content = await f.read()
+        except FileNotFoundError:
+            self.log.error("Phone list not found: {}", self.phone_list_path)
+            raise FileNotFoundError(f"Phone list not found: {self.phone_list_path}") from None
+
+        # Parsing is CPU-bound; keep it off the event loop
+        self._numbers = await asyncio.to_thread(self._parse_phone_list, content)
+        self._requeue()
+        self.log.debug("Loaded {} phone numbers from file", len(self._numbers))
+
+    def _parse_phone_list(
+        self,
+        content: str,
+    ) -> dict[str, None]:
+        """
+        Parse phone list file content.
+
+        Args:
+            content: Full text of the phone list file.
+
+        Returns:
+            Unique valid numbers (digits only) in file order, as dict keys.
+        """
+        # Ordered set: repeated lines (even differently formatted) count once
+        numbers: dict[str, None] = {}
+        lines = 0
+        for line in content.splitlines():
+            number = line.strip()
+            if not number:
+                continue
+            if not _has_digit(number):
+                self.log.warning("Invalid phone number '{}': no digits", number)
+                continue
+            lines += 1
+            numbers[sys.intern(digits_only(number))] = None
+
+        if lines > len(numbers):
+            self.log.debug("Skipped {} duplicate phone numbers", lines - len(numbers))
 
         return numbers
 
+    def _requeue(self) -> None:
+        """Rebuild the pending queue from the phone list minus processed numbers."""
+        processed = self._processed
+        # Unprocessed numbers in file order; get_next serves the head
+        self._pending = deque(n for n in self._numbers if n not in processed)
+        self._available = len(self._pending)
+
+    def _add_processed(self, numbers: list[str]) -> None:
+        """Add numbers to the processed set, keeping the available count exact."""
+        processed = self._processed
+        listed = self._numbers
+        for number in numbers:
+            if number not in processed:
+                processed.add(number)
+                if number in listed:
+                    self._available -= 1
+
+    def _read_new_numbers(self, filepath: Path, numbers: set[str]) -> bool:
+        """
+        Add numbers appended to a text file (one per line) since the last read.
+
+        Only the bytes past the stored offset are read, so a refresh costs
+        O(newly appended) rather than O(file). A file that shrank or
+        disappeared is treated as rewritten and read again from the start.
+
+        New numbers are also added to the combined processed set.
+
+        Args:
+            filepath: Processed-numbers file to read.
+            numbers: Set to update in place.
+
+        Returns:
+            True if the file was rewritten and ``numbers`` was rebuilt.
+        """
+        offset = self._offsets.get(filepath, 0)
+        try:
+            size = os.stat(filepath).st_size
+        except FileNotFoundError:
+            size = 0
+        if size == offset:
+            return False
+        rewritten = size < offset
+        if rewritten:
+            numbers.clear()
+            offset = 0
+            if not size:
+                self._offsets[filepath] = 0
+                return True
+
+        try:
+            with open(filepath, "rb") as f:
+                # Shared lock: never observe a half-written line from another run
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                f.seek(offset)
+                chunk = f.read()
+        except Exception as e:
+            self.log.error("Error reading {}: {}", filepath, e)
+            return rewritten
+
+        # split() drops blank lines and surrounding whitespace (incl. \r)
+        new_numbers = [sys.intern(line.decode()) for line in chunk.split()]
+        numbers.update(new_numbers)
+        self._add_processed(new_numbers)
+        self._offsets[filepath] = offset + len(chunk)
+        self.log.debug("Read {} new bytes from {}", len(chunk), filepath.name)
+        return rewritten
+
+    def _append_fd(self, filepath: Path) -> int:
+        """
+        Get the O_APPEND descriptor for a file, reopening it if needed.
+
+        The cached descriptor is only reused while it still refers to the
+        file at ``filepath``; if the file was deleted or replaced, writes
+        would otherwise land in an unlinked inode.
+
+        Args:
+            filepath: Processed-numbers file to append to.
+
+        Returns:
+            Open file descriptor.
+        """
+        fd = self._fds.get(filepath)
+        if fd is not None:
+            held = os.fstat(fd)
+            try:
+                current = os.stat(filepath)
+            except FileNotFoundError:
+                current = None
+            if current is not None and (current.st_dev, current.st_ino) == (held.st_dev, held.st_ino):
+                return fd
+            self._close_fd(filepath)
+
+        if not self._close_at_exit:
+            atexit.register(self.close)
+            self._close_at_exit = True
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._fds[filepath] = fd
+        return fd
+
     def _append_to_file(self, filepath: Path, phone: str) -> None:
-        """Append a phone number to a file."""
+        """Append a phone number to a file with a single write() call."""
         try:
-            with open(filepath, "a", encoding="utf-8") as f:
-                f.write(f"{phone}\n")
-            self.log.debug(f"Added {phone} to {filepath.name}")
+            fd = self._append_fd(filepath)
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                os.write(fd, f"{phone}\n".encode())
+            finally:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            self.log.debug("Added {} to {}", phone, filepath.name)
         except Exception as e:
-            self.log.error(f"Error writing to {filepath}: {e}")
+            self.log.error("Error writing to {}: {}", filepath, e)
+
+    def _close_fd(self, filepath: Path) -> None:
+        """Close the append descriptor for a file, if one is open."""
+        fd = self._fds.pop(filepath, None)
+        if fd is not None:
+            os.close(fd)
+
+    def close(self) -> None:
+        """Close the append descriptors held for the processed files."""
+        for filepath in list(self._fds):
+            self._close_fd(filepath)
+        if self._close_at_exit:
+            atexit.unregister(self.close)
+            self._close_at_exit = False
 
     def _is_processed(self, phone_number: str) -> bool:
         """Check if a phone number is already processed (success or failed)."""
-        return phone_number in self._success_numbers or phone_number in self._failed_numbers
+        return phone_number in self._processed
+
+    def _discard_head(self, phone: PhoneNumber) -> None:
+        """Pop the phone off the pending queue if it is the current head."""
+        if self._pending and self._pending[0] == phone.number:
+            self._pending.popleft()
+
+    def refresh(self) -> None:
+        """
+        Re-read the success and failed files to pick up concurrent runs.
+
+        Only lines appended since the previous read are parsed. If either
+        file was truncated or edited, numbers no longer listed in it are
+        queued again.
+        """
+        success_rewritten = self._read_new_numbers(SUCCESS_FILE, self._success_numbers)
+        failed_rewritten = self._read_new_numbers(FAILED_FILE, self._failed_numbers)
+        if success_rewritten or failed_rewritten:
+            self._processed = self._success_numbers | self._failed_numbers
+            self._requeue()
 
     def get_next(self) -> PhoneNumber | None:
         """
@@ -143,13 +322,17 @@ class PhoneManager(LoggerMixin):
             raise RuntimeError("PhoneManager not loaded. Call load() first.")
 
         # Re-read files to get latest processed numbers (in case of concurrent runs)
-        self._success_numbers = self._load_numbers_from_file(SUCCESS_FILE)
-        self._failed_numbers = self._load_numbers_from_file(FAILED_FILE)
+        self.refresh()
+
+        # Drop heads processed here or by another run since the last call
+        pending = self._pending
+        while pending and self._is_processed(pending[0]):
+            pending.popleft()
 
-        for phone in self._all_phones:
-            if not self._is_processed(phone.number):
-                self.log.info(f"Next available phone: {phone.formatted}")
-                return phone
+        if pending:
+            phone = PhoneNumber(number=pending[0], platform=self.platform)
+            self.log.info("Next available phone: {}", phone.formatted)
+            return phone
 
         self.log.warning("No available phone numbers remaining")
         return None
@@ -166,10 +349,12 @@ class PhoneManager(LoggerMixin):
 
         # Add to success file
         self._success_numbers.add(phone.number)
+        self._add_processed([phone.number])
+        self._discard_head(phone)
         self._append_to_file(SUCCESS_FILE, phone.number)
 
         available = self.available_count
-        self.log.info(f"SUCCESS: {phone.formatted} ({available} remaining)")
+        self.log.info("SUCCESS: {} ({} remaining)", phone.formatted, available)
 
     async def mark_failed(self, phone: PhoneNumber) -> None:
         """
@@ -183,10 +368,12 @@ class PhoneManager(LoggerMixin):
 
         # Add to failed file
         self._failed_numbers.add(phone.number)
+        self._add_processed([phone.number])
+        self._discard_head(phone)
         self._append_to_file(FAILED_FILE, phone.number)
 
         available = self.available_count
-        self.log.info(f"FAILED: {phone.formatted} ({available} remaining)")
+        self.log.info("FAILED: {} ({} remaining)", phone.formatted, available)
 
     async def mark_used(self, phone: PhoneNumber, success: bool = True) -> None:
         """
@@ -203,12 +390,14 @@ class PhoneManager(LoggerMixin):
 
     @property
     def available_count(self) -> int:
-        """Get the count of available phone numbers."""
-        # Re-read files to get latest
-        self._success_numbers = self._load_numbers_from_file(SUCCESS_FILE)
-        self._failed_numbers = self._load_numbers_from_file(FAILED_FILE)
-        processed = len(self._success_numbers) + len(self._failed_numbers)
-        return len(self._all_phones) - processed
+        """
+        Get the count of available phone numbers.
+
+        Counts listed numbers that are not processed, so it is zero exactly
+        when get_next() has nothing to hand out. Kept current by ``mark_*``;
+        call ``refresh()`` to pick up numbers written by other runs.
+        """
+        return self._available
 
     @property
     def success_count(self) -> int:
@@ -223,7 +412,7 @@ class PhoneManager(LoggerMixin):
     @property
     def total_count(self) -> int:
         """Get the total count of phone numbers."""
-        return len(self._all_phones)
+        return len(self._numbers)
 
     # Kept for compatibility
     @property
@@ -234,7 +423,7 @@ class PhoneManager(LoggerMixin):
     def get_stats(self) -> dict:
         """Get usage statistics."""
         return {
-            "platform": str(self.platform),
+            "platform": self._platform_str,
             "total": self.total_count,
             "success": self.success_count,
             "failed": self.failed_count,